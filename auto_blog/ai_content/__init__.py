@@ -6,5 +6,6 @@ Handles content generation using different AI providers.
 from .ai_factory import AIFactory, AIGenerator
 from .openai_generator import OpenAIGenerator
 from .gemini_generator import GeminiGenerator
+from .ai_cache import CachedAIGenerator
 
-__all__ = ['AIFactory', 'AIGenerator', 'OpenAIGenerator', 'GeminiGenerator']
+__all__ = ['AIFactory', 'AIGenerator', 'OpenAIGenerator', 'GeminiGenerator', 'CachedAIGenerator']
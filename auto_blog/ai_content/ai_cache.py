@@ -0,0 +1,261 @@
+"""
+Persistent cache for AI content generation.
+Wraps an AI generator so re-syndicated articles reuse an earlier response
+instead of triggering another paid API call.
+"""
+
+import os
+import json
+import time
+import string
+import sqlite3
+import hashlib
+import logging
+import threading
+from typing import Dict, Any, FrozenSet, List, Optional, Tuple
+from .ai_factory import AIGenerator
+
+logger = logging.getLogger(__name__)
+
+# Punctuation is dropped so minor rewording by syndicators still hits the cache
+_NORMALIZE_TABLE = str.maketrans('', '', string.punctuation)
+
+# Near-duplicate matching needs enough words to tell stories apart
+MIN_SIMILARITY_TOKENS = 8
+
+class CachedAIGenerator(AIGenerator):
+    """
+    AI generator decorator backed by an on-disk SQLite cache.
+    Responses are keyed by the normalized article title, description and
+    source together with the model and generation settings. On an exact miss,
+    a story whose title and description share most of their words with a
+    cached one (the same news republished by another feed) reuses its response.
+    """
+
+    def __init__(self, wrapped: AIGenerator, db_path: str, ttl_days: int = 30,
+                 similarity_threshold: float = 0.9):
+        """
+        Initialize the cached generator.
+
+        Args:
+            wrapped: The AI generator to call on cache misses
+            db_path: Path to the SQLite cache database
+            ttl_days: Number of days a cached response stays valid
+            similarity_threshold: Minimum word-set Jaccard similarity for a
+                near-duplicate hit (values above 1 disable near-duplicate matching)
+        """
+        self.wrapped = wrapped
+        self.model = getattr(wrapped, 'model', '')
+        self.db_path = db_path
+        self.ttl_seconds = ttl_days * 86400
+        self.similarity_threshold = similarity_threshold
+
+        # Producers generate items on several threads; sqlite connections
+        # are shared across them behind a lock
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS exact "
+                "(key TEXT PRIMARY KEY, response TEXT NOT NULL, ts REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS similar "
+                "(key TEXT PRIMARY KEY, settings TEXT NOT NULL, tokens TEXT NOT NULL, ts REAL NOT NULL)"
+            )
+            cutoff = time.time() - self.ttl_seconds
+            self._conn.execute("DELETE FROM exact WHERE ts < ?", (cutoff,))
+            self._conn.execute("DELETE FROM similar WHERE ts < ?", (cutoff,))
+        
+        # Word sets of cached stories, scanned in memory on exact misses
+        self._similar: Dict[str, List[Tuple[FrozenSet[str], str]]] = {}
+        for key, settings, tokens in self._conn.execute("SELECT key, settings, tokens FROM similar"):
+            self._similar.setdefault(settings, []).append((frozenset(tokens.split()), key))
+        logger.info(f"AI response cache enabled at {db_path}")
+
+    @staticmethod
+    def _normalize(text: Any) -> str:
+        """
+        Normalize text for cache keys by stripping punctuation, lowercasing
+        and collapsing whitespace.
+
+        Args:
+            text: Text to normalize
+
+        Returns:
+            Normalized text
+        """
+        return ' '.join(str(text or '').translate(_NORMALIZE_TABLE).lower().split())
+
+    def _settings_key(self, max_words: int, style: str) -> str:
+        """
+        Describe the generation settings a cached response is only valid for.
+
+        Args:
+            max_words: Maximum word count for the generated post
+            style: The writing style to use
+
+        Returns:
+            Settings identifier
+        """
+        return f"{self.model}\x1f{max_words}\x1f{self._normalize(style)}"
+
+    def _tokenize(self, article_data: Dict[str, Any]) -> FrozenSet[str]:
+        """
+        Get the distinctive words of an article's title and description.
+
+        Args:
+            article_data: Dictionary containing article information
+
+        Returns:
+            Set of normalized words longer than two characters
+        """
+        text = self._normalize(f"{article_data.get('title') or ''} {article_data.get('description') or ''}")
+        return frozenset(word for word in text.split() if len(word) > 2)
+
+    def _find_similar(self, settings: str, tokens: FrozenSet[str]) -> Optional[str]:
+        """
+        Find the cache key of the most similar cached story.
+
+        Args:
+            settings: Settings identifier the response must match
+            tokens: Word set of the article being generated
+
+        Returns:
+            Cache key of the best match at or above the threshold, or None
+        """
+        if len(tokens) < MIN_SIMILARITY_TOKENS or self.similarity_threshold > 1:
+            return None
+        best_key, best_score = None, self.similarity_threshold
+        with self._lock:
+            candidates = list(self._similar.get(settings, ()))
+        for cached_tokens, key in candidates:
+            score = len(tokens & cached_tokens) / len(tokens | cached_tokens)
+            if score >= best_score:
+                best_key, best_score = key, score
+        return best_key
+
+    def _make_key(self, article_data: Dict[str, Any], max_words: int, style: str) -> str:
+        """
+        Build the cache key for a generation request.
+
+        Args:
+            article_data: Dictionary containing article information
+            max_words: Maximum word count for the generated post
+            style: The writing style to use
+
+        Returns:
+            Hex digest identifying the request
+        """
+        parts = [
+            self._normalize(article_data.get('title')),
+            self._normalize(article_data.get('description')),
+            self._normalize(article_data.get('source_name')),
+            self._settings_key(max_words, style),
+        ]
+        return hashlib.blake2b('\x1f'.join(parts).encode('utf-8'), digest_size=16).hexdigest()
+
+    def _lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch a cached response that has not expired.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached response dictionary, or None on a miss
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM exact WHERE key = ? AND ts >= ?",
+                (key, time.time() - self.ttl_seconds)
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            return json.loads(row[0])
+        except json.JSONDecodeError:
+            return None
+
+    def _store(self, key: str, response: Dict[str, Any], settings: str, tokens: FrozenSet[str]):
+        """
+        Store a response in the cache.
+
+        Args:
+            key: Cache key
+            response: Generated response to store
+            settings: Settings identifier the response was generated with
+            tokens: Word set of the article, for near-duplicate lookups
+        """
+        try:
+            payload = json.dumps(response)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Not caching AI response that is not JSON serializable: {str(e)}")
+            return
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO exact (key, response, ts) VALUES (?, ?, ?)",
+                (key, payload, now)
+            )
+            if len(tokens) >= MIN_SIMILARITY_TOKENS:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO similar (key, settings, tokens, ts) VALUES (?, ?, ?, ?)",
+                    (key, settings, ' '.join(sorted(tokens)), now)
+                )
+                self._similar.setdefault(settings, []).append((tokens, key))
+
+    def generate_blog_post(self,
+                          article_data: Dict[str, Any],
+                          max_words: int = 1000,
+                          style: str = "informative and engaging") -> Dict[str, Any]:
+        """
+        Generate a blog post, reusing a cached response when one exists.
+
+        Args:
+            article_data: Dictionary containing article information
+            max_words: Maximum word count for the generated post
+            style: The writing style to use
+
+        Returns:
+            Dictionary containing the generated blog post content and metadata
+        """
+        key = self._make_key(article_data, max_words, style)
+        settings = self._settings_key(max_words, style)
+        tokens = self._tokenize(article_data)
+
+        try:
+            cached = self._lookup(key)
+            if cached is None:
+                similar_key = self._find_similar(settings, tokens)
+                if similar_key is not None:
+                    cached = self._lookup(similar_key)
+                    if cached is not None:
+                        logger.info(f"AI cache near-duplicate hit for: {article_data.get('title', '')}")
+        except sqlite3.Error as e:
+            logger.warning(f"AI cache lookup failed: {str(e)}")
+            cached = None
+
+        if cached is not None:
+            logger.info(f"AI cache hit for: {article_data.get('title', '')}")
+            # The same story may arrive under a different URL
+            if 'source_url' in cached and article_data.get('source_url'):
+                cached['source_url'] = article_data['source_url']
+            return cached
+
+        result = self.wrapped.generate_blog_post(article_data, max_words=max_words, style=style)
+
+        # Never cache the placeholder returned for a failed generation
+        if 'error' not in result:
+            try:
+                self._store(key, result, settings, tokens)
+            except sqlite3.Error as e:
+                logger.warning(f"AI cache store failed: {str(e)}")
+
+        return result
+
+    def close(self):
+        """Close the cache database."""
+        with self._lock:
+            self._conn.close()
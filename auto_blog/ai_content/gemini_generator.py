@@ -2,7 +2,6 @@
 Google Gemini content generator implementation.
 """
 
-import google.generativeai as genai
 from typing import Dict, Any, List, Optional
 import logging
 import json
@@ -23,6 +22,9 @@ class GeminiGenerator(AIGenerator):
             api_key: Google Gemini API key
             model: Gemini model to use (defaults to gemini-pro)
         """
+        # Imported here so the SDK is only loaded when this provider is used
+        import google.generativeai as genai
+        
         genai.configure(api_key=api_key)
         self.model = model or "gemini-pro"
         self.genai = genai
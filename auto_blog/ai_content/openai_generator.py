@@ -2,12 +2,12 @@
 OpenAI content generator implementation.
 """
 
-import openai
 import re
 from typing import Dict, Any, List, Optional
 import logging
 import json
 from .ai_factory import AIGenerator
+from ..utils.http_utils import get_session
 
 logger = logging.getLogger(__name__)
 
@@ -24,8 +24,14 @@ class OpenAIGenerator(AIGenerator):
             api_key: OpenAI API key
             model: OpenAI model to use (defaults to gpt-3.5-turbo)
         """
+        # Imported here so the SDK is only loaded when this provider is used
+        import openai
+        
         # Set API key for v0.28.0
         openai.api_key = api_key
+        # Share pooled connections and retry transient errors (429/5xx) with backoff
+        openai.requestssession = get_session()
+        self.openai = openai
         self.model = model or "gpt-3.5-turbo"
         logger.info(f"Initialized OpenAI generator with model: {self.model}")
     
@@ -102,7 +108,7 @@ class OpenAIGenerator(AIGenerator):
         
         try:
             # Call OpenAI API (compatible with v0.28.0)
-            response = openai.ChatCompletion.create(
+            response = self.openai.ChatCompletion.create(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": system_prompt},
@@ -159,5 +165,6 @@ class OpenAIGenerator(AIGenerator):
                 "tags": [],
                 "meta_description": description,
                 "source_url": source_url,
-                "source_name": source_name
+                "source_name": source_name,
+                "error": str(e)
             } 
\ No newline at end of file
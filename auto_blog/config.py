@@ -63,11 +63,20 @@ OPENAI_API_KEY = get_env_value('OPENAI_API_KEY')
 OPENAI_MODEL = get_env_value('OPENAI_MODEL', 'gpt-3.5-turbo')
 GEMINI_API_KEY = get_env_value('GEMINI_API_KEY')
 GEMINI_MODEL = get_env_value('GEMINI_MODEL', 'gemini-pro')
+AI_CACHE_ENABLED = get_env_value('AI_CACHE_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+AI_CACHE_TTL_DAYS = int(get_env_value('AI_CACHE_TTL_DAYS', '30'))
+AI_CACHE_SIMILARITY = float(get_env_value('AI_CACHE_SIMILARITY', '0.9'))
+AI_CONCURRENCY = max(1, int(get_env_value('AI_CONCURRENCY', '4')))
+# Regenerate posts even when a post with the same slug already exists
+FORCE_REGENERATE = get_env_value('FORCE_REGENERATE', 'false').lower() in ('1', 'true', 'yes')
 
 # RSS Feed Configuration
 RSS_FEEDS = get_env_value('RSS_FEEDS', '').split(',')
 MAX_RSS_ITEMS = int(get_env_value('MAX_RSS_ITEMS', '25'))
 MAX_ARTICLE_AGE_DAYS = int(get_env_value('MAX_ARTICLE_AGE_DAYS', '3'))
+RSS_FETCH_WORKERS = max(1, int(get_env_value('RSS_FETCH_WORKERS', '8')))
+RSS_MAX_PER_HOST = max(1, int(get_env_value('RSS_MAX_PER_HOST', '2')))
+FEED_CACHE_ENABLED = get_env_value('FEED_CACHE_ENABLED', 'false').lower() in ('1', 'true', 'yes')
 
 # Jekyll Settings
 JEKYLL_CATEGORIES = get_env_value('JEKYLL_CATEGORIES', 'Technology,News,AI,Programming').split(',')
@@ -140,11 +149,19 @@ def get_config() -> Dict[str, Any]:
         'openai_model': OPENAI_MODEL,
         'gemini_api_key': GEMINI_API_KEY,
         'gemini_model': GEMINI_MODEL,
+        'ai_cache_enabled': AI_CACHE_ENABLED,
+        'ai_cache_ttl_days': AI_CACHE_TTL_DAYS,
+        'ai_cache_similarity': AI_CACHE_SIMILARITY,
+        'ai_concurrency': AI_CONCURRENCY,
+        'force_regenerate': FORCE_REGENERATE,
         
         # RSS Feed Configuration
         'rss_feeds': RSS_FEEDS,
         'max_rss_items': MAX_RSS_ITEMS,
         'max_article_age_days': MAX_ARTICLE_AGE_DAYS,
+        'rss_fetch_workers': RSS_FETCH_WORKERS,
+        'rss_max_per_host': RSS_MAX_PER_HOST,
+        'feed_cache_enabled': FEED_CACHE_ENABLED,
         
         # Jekyll Settings
         'jekyll_categories': JEKYLL_CATEGORIES,
@@ -15,6 +15,10 @@ import subprocess
 
 logger = logging.getLogger(__name__)
 
+# Bump when the bootstrap steps change so existing checkouts redo them once
+BOOTSTRAP_VERSION = "1"
+BOOTSTRAP_MARKER = "autoblog_bootstrap_ok"
+
 class GitHubManager:
     """
     Handles interaction with GitHub repository for publishing blog posts.
@@ -84,6 +88,10 @@ class GitHubManager:
             True if the repository exists or was created successfully, False otherwise
         """
         try:
+            # Reuse the repository handle if this manager already loaded it
+            if self.repo is not None:
+                return True
+            
             # Check if the repo directory exists
             repo_path = Path(self.repo_path)
             if repo_path.exists() and repo_path.is_dir():
@@ -93,6 +101,11 @@ class GitHubManager:
                     import git
                     self.repo = git.Repo(self.repo_path)
                     
+                    # Remote and identity were already configured by an earlier run
+                    if self._is_bootstrapped():
+                        logger.debug("Repository bootstrap marker is current, skipping setup")
+                        return True
+                    
                     # Check if the remote is set correctly
                     try:
                         origin_url = self.repo.remotes.origin.url
@@ -120,6 +133,7 @@ class GitHubManager:
                         config.set_value('user', 'email', self.github_email)
                     logger.info("Configured user and email")
                     
+                    self._mark_bootstrapped()
                     return True
                     
                 except (ImportError, Exception) as e:
@@ -136,6 +150,39 @@ class GitHubManager:
             logger.error(f"Error ensuring repository exists: {e}")
             return False
     
+    def _bootstrap_fingerprint(self) -> str:
+        """
+        Build the marker contents identifying the settings a bootstrap applied.
+        
+        Returns:
+            Marker file contents for the current configuration
+        """
+        return (f"{BOOTSTRAP_VERSION}\n"
+                f"https://github.com/{self.github_username}/{self.github_repo}.git\n"
+                f"{self.github_username}\n{self.github_email}\n")
+    
+    def _is_bootstrapped(self) -> bool:
+        """
+        Check whether the marker in .git matches the current configuration.
+        
+        Returns:
+            True if setup for this configuration already completed, False otherwise
+        """
+        try:
+            marker_path = Path(self.repo.git_dir) / BOOTSTRAP_MARKER
+            return marker_path.read_text(encoding='utf-8') == self._bootstrap_fingerprint()
+        except OSError:
+            return False
+    
+    def _mark_bootstrapped(self):
+        """Record a completed bootstrap so warm runs can skip the setup steps."""
+        try:
+            # Kept inside .git so the marker is never committed
+            marker_path = Path(self.repo.git_dir) / BOOTSTRAP_MARKER
+            marker_path.write_text(self._bootstrap_fingerprint(), encoding='utf-8')
+        except OSError as e:
+            logger.warning(f"Could not write bootstrap marker: {e}")
+    
     def _init_and_configure_repo(self) -> bool:
         """
         Initialize and configure a new git repository.
@@ -201,7 +248,8 @@ class GitHubManager:
                 self.repo.git.checkout('-b', clean_branch)
             
             # Set up Jekyll structure
-            self.ensure_jekyll_structure()
+            if self.ensure_jekyll_structure():
+                self._mark_bootstrapped()
             
             return True
             
@@ -248,7 +296,7 @@ class GitHubManager:
                 
                 # Read the existing config
                 with open(config_path, 'r', encoding='utf-8') as f:
-                    config_content = f.read()
+                    config_content = original_content = f.read()
                 
                 # Update basic information in the config
                 replace_pairs = {
@@ -282,17 +330,19 @@ class GitHubManager:
                             'baseurl                  : ""'
                         )
                 
-                # Write updated config back to file
-                with open(config_path, 'w', encoding='utf-8') as f:
-                    f.write(config_content)
-                logger.info("Updated _config.yml with user settings")
+                # Write updated config back to file only if a placeholder was replaced
+                if config_content != original_content:
+                    with open(config_path, 'w', encoding='utf-8') as f:
+                        f.write(config_content)
+                    logger.info("Updated _config.yml with user settings")
                 
                 # Create/update CNAME file for custom domain if provided
                 if custom_domain:
                     cname_path = repo_dir / "CNAME"
-                    with open(cname_path, 'w') as f:
-                        f.write(custom_domain)
-                    logger.info(f"Created CNAME file with domain: {custom_domain}")
+                    if not cname_path.exists() or cname_path.read_text().strip() != custom_domain:
+                        with open(cname_path, 'w') as f:
+                            f.write(custom_domain)
+                        logger.info(f"Created CNAME file with domain: {custom_domain}")
             else:
                 logger.warning("_config.yml not found, minimal-mistakes theme might not be properly set up")
             
@@ -341,23 +391,32 @@ This is an automated tech blog powered by AI. The content is generated by proces
                 if not self.ensure_repo_exists():
                     return False
             
-            # Check if there are untracked files that might be overwritten
+            # A single porcelain status call tells us about both untracked
+            # files and uncommitted changes, instead of one git process each
             has_untracked = False
+            has_changes = False
             try:
-                # Check for untracked files
-                untracked_files = self.repo.git.ls_files('--others', '--exclude-standard')
-                has_untracked = bool(untracked_files.strip())
-                
-                if has_untracked:
+                status_lines = self.repo.git.status('--porcelain').splitlines()
+                has_untracked = any(line.startswith('??') for line in status_lines)
+                has_changes = any(not line.startswith('??') for line in status_lines)
+            except Exception as status_error:
+                logger.warning(f"Error checking repository status: {status_error}")
+                # Fall back to GitPython's dirty check below
+                has_changes = self.repo.is_dirty()
+            
+            # Check if there are untracked files that might be overwritten
+            if has_untracked:
+                try:
                     logger.info("Found untracked files, stashing them before pull")
                     # Stash untracked files
                     self.repo.git.stash('--include-untracked')
-            except Exception as stash_error:
-                logger.warning(f"Error checking or stashing untracked files: {stash_error}")
-                # Continue with the pull anyway
+                except Exception as stash_error:
+                    logger.warning(f"Error stashing untracked files: {stash_error}")
+                    has_untracked = False
+                    # Continue with the pull anyway
             
             # Make sure the repository is in a clean state
-            if self.repo.is_dirty():
+            if has_changes:
                 logger.warning("Repository has uncommitted changes. Attempting to reset...")
                 self.repo.git.reset('--hard')
             
@@ -372,23 +431,23 @@ This is an automated tech blog powered by AI. The content is generated by proces
             # Make sure we use the clean branch name without any comments
             clean_branch = self.branch.split('#')[0].strip()
             
-            # Try fetch first to check connectivity
+            # Fetch once; the merge below works off the fetched refs so we
+            # don't pay for a second network round trip inside `git pull`
             logger.info(f"Fetching from remote...")
             origin.fetch()
             
-            # Then pull with --ff-only to avoid merge conflicts
+            # Then fast-forward only to avoid merge conflicts
             logger.info(f"Pulling latest changes from {clean_branch} branch")
+            remote_branch = f"origin/{clean_branch}"
             try:
-                origin.pull(clean_branch, ff_only=True)
+                self.repo.git.merge('--ff-only', remote_branch)
             except Exception as pull_error:
                 logger.warning(f"Error pulling with --ff-only: {pull_error}")
                 logger.info("Trying alternative pull strategy...")
                 
-                # If the --ff-only pull fails, try to reset to the remote branch
+                # If the fast-forward fails, try to reset to the remote branch
                 try:
-                    remote_branch = f"origin/{clean_branch}"
-                    logger.info(f"Fetching from {remote_branch} and resetting")
-                    self.repo.git.fetch('origin', clean_branch)
+                    logger.info(f"Resetting to {remote_branch}")
                     
                     # Check if the branch exists in the remote
                     remote_refs = [ref.name for ref in self.repo.remote().refs]
@@ -443,8 +502,9 @@ This is an automated tech blog powered by AI. The content is generated by proces
                 subprocess.run(["git", "add", "--all"], check=True)
                 logger.info("Added all files using direct git command")
             
-            # Check if there are changes to commit
-            status = self.repo.git.status(porcelain=True)
+            # Check if there are changes to commit; everything was just staged,
+            # so skip the untracked-file scan of the working tree
+            status = self.repo.git.status(porcelain=True, untracked_files='no')
             if not status:
                 logger.info("No changes to commit")
                 return True
@@ -540,13 +600,12 @@ This is an automated tech blog powered by AI. The content is generated by proces
             os.chdir(self.repo_path)
             
             # Add all files
-            self.repo.git.add(A=True)  # Same as 'git add --all'
-            
-            # As a backup, use direct git command
             try:
+                self.repo.git.add(A=True)  # Same as 'git add --all'
+            except Exception as e:
+                # Fall back to direct git command only if GitPython fails
+                logger.warning(f"GitPython add failed: {str(e)}, falling back to direct git command")
                 subprocess.run(["git", "add", "--all"], cwd=self.repo_path, check=True)
-            except Exception as cmd_error:
-                logger.warning(f"Direct git command failed, but GitPython method may have succeeded: {cmd_error}")
             
             # Check if there are changes to commit
             if not self.repo.is_dirty():
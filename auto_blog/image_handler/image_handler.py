@@ -14,6 +14,7 @@ from PIL import Image
 import io
 import random
 import time
+from ..utils.http_utils import get_session
 
 logger = logging.getLogger(__name__)
 
@@ -22,14 +23,16 @@ class ImageHandler:
     Handles downloading, processing, and storing images for blog posts.
     """
     
-    def __init__(self, image_dir: str):
+    def __init__(self, image_dir: str, session: Optional[requests.Session] = None):
         """
         Initialize the image handler.
         
         Args:
             image_dir: Directory to store downloaded images
+            session: HTTP session to reuse connections with (defaults to the shared session)
         """
         self.image_dir = image_dir
+        self.session = session or get_session()
         
         # Create the image directory if it doesn't exist
         os.makedirs(self.image_dir, exist_ok=True)
@@ -63,7 +66,7 @@ class ImageHandler:
             # Download the image
             logger.info(f"Downloading image from {url}")
             headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self.session.get(url, headers=headers, timeout=10)
             response.raise_for_status()
             
             # Process the image
@@ -78,6 +81,59 @@ class ImageHandler:
             logger.error(f"Error downloading image from {url}: {str(e)}")
             return None
     
+    def download_and_resize(self, url: str, article_title: str = "",
+                            max_width: int = 800) -> Optional[str]:
+        """
+        Download an image and save it already resized, decoding it only once.
+        JPEGs are decoded at a reduced scale when they are much wider than needed.
+        
+        Args:
+            url: URL of the image to download
+            article_title: Title of the article (used for filename generation)
+            max_width: Maximum width for the saved image
+            
+        Returns:
+            Path to the saved image, or None if download or processing failed
+        """
+        if not url:
+            logger.warning("No image URL provided")
+            return None
+        
+        try:
+            filename = self._generate_filename(url, article_title)
+            filepath = os.path.join(self.image_dir, filename)
+            
+            if os.path.exists(filepath):
+                logger.info(f"Image already exists at {filepath}")
+                return filepath
+            
+            logger.info(f"Downloading image from {url}")
+            headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
+            response = self.session.get(url, headers=headers, timeout=10)
+            response.raise_for_status()
+            
+            with Image.open(io.BytesIO(response.content)) as img:
+                # Let libjpeg scale down by a power of two while decoding,
+                # keeping the width at or above max_width
+                img.draft(None, (max_width, 1))
+                
+                width, height = img.size
+                if width > max_width:
+                    new_height = int(height * (max_width / width))
+                    img = img.resize((max_width, new_height), Image.LANCZOS)
+                    logger.info(f"Image resized to {max_width}x{new_height}")
+                
+                if os.path.splitext(filepath)[1] in ('.jpg', '.jpeg') and img.mode not in ('RGB', 'L'):
+                    img = img.convert('RGB')
+                
+                img.save(filepath)
+            
+            logger.info(f"Image saved to {filepath}")
+            return filepath
+        except Exception as e:
+            logger.error(f"Error downloading image from {url}: {str(e)}")
+            return None
+    
     def download_images_from_list(self, urls: List[str], article_title: str = "") -> List[str]:
         """
         Download multiple images from a list of URLs.
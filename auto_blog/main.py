@@ -4,17 +4,18 @@ Handles the coordination of all components.
 """
 
 import os
-import logging
+import re
 import sys
-import random
+import atexit
+import logging
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import Dict, Any, Iterator, Optional
 import time
-from PIL import Image, ImageDraw, ImageFont
-from dotenv import load_dotenv
-import requests
-import json
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # Import configuration and exceptions
 from . import config
@@ -22,28 +23,80 @@ from .utils.exceptions import (
     AutoBlogError, ContentGenerationError, PostCreationError,
     ImageProcessingError, JSONParsingError, AIProviderError
 )
-from .rss_fetcher import RSSFetcher
-from .ai_content import AIFactory
-from .image_handler import ImageHandler
-from .post_generator import PostGenerator
-from .github_manager import GitHubManager
-from .utils import create_directory, PostHistory
-from .webhook_handler import wehbook_handler
-from .scraper.sheets_handler import GoogleSheetsHandler
-# Set up logging
-log_dir = Path(__file__).parent.parent / "logs"
-create_directory(str(log_dir))
+from .utils import create_directory, get_session, PostHistory
+
+# Capture the run start once so the commit message names the day the run
+# began, even when it crosses midnight
+RUN_START = datetime.now()
+RUN_DATE = RUN_START.strftime('%Y-%m-%d')
+
+logger = logging.getLogger(__name__)
+
+# Patterns applied to every generated post by filteredContent. The removals
+# are fused into one alternation so the content is scanned once for all of them
+_RE_EXAMPLE_BARE = re.compile(r'\bhttps?://(?:www\.)?example\.com\b')
+_RE_FILTER = re.compile(
+    r'(?P<codeblock>```(?:markdown)?[\s\S]*?```)'
+    r'|(?P<nonhttp>\[[^\]]+\]\((?!http)[^\)]+\))'
+    r'|\[(?P<exmd>[^\]]+)\]\(https?://(?:www\.)?example\.com\)'
+    r'|(?P<exbare>\bhttps?://(?:www\.)?example\.com\b)'
+)
+_RE_LINKTEXT = re.compile(r'\[link text\]\((https?://[^\)]+)\)')
+
+def _filter_match(match: re.Match) -> str:
+    """
+    Replacement for a _RE_FILTER match.
+
+    Args:
+        match: Match of one of the filter alternatives
+
+    Returns:
+        The link text for example.com markdown links, otherwise an empty string
+    """
+    if match.lastgroup == 'exmd':
+        return _RE_EXAMPLE_BARE.sub('', match.group('exmd'))
+    return ''
+
+# Generated posts shorter than this after filtering are not worth publishing
+MIN_CONTENT_LENGTH = 200
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(log_dir / f"autoblog_{datetime.now().strftime('%Y%m%d')}.log"),
+# Boilerplate feed titles replaced with the publication name
+_CONTENT_REPLACEMENTS = {
+    "Engadget is a web magazine with obsessive daily coverage of everything new in gadgets and consumer electronics": "Engadget",
+    "Ars Technica - All content": "Ars Technica"
+}
+
+def setup_logging() -> None:
+    """
+    Configure logging to a daily rotating file and stdout.
+    Called from main() so importing this module has no side effects.
+    """
+    log_dir = config.PROJECT_ROOT / "logs"
+    create_directory(str(log_dir))
+
+    # Records are queued by the logging threads and written by a single listener
+    # thread, so workers never block on file or console I/O
+    log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    log_handlers = [
+        TimedRotatingFileHandler(log_dir / "autoblog.log", when='midnight', backupCount=14,
+                                 encoding='utf-8', delay=True),
         logging.StreamHandler(sys.stdout)
     ]
-)
+    for log_handler in log_handlers:
+        log_handler.setFormatter(log_formatter)
 
-logger = logging.getLogger(__name__)
+    log_queue = queue.Queue(-1)
+    log_listener = QueueListener(log_queue, *log_handlers)
+    log_listener.start()
+    atexit.register(log_listener.stop)
+
+    # force replaces handlers installed by modules imported earlier
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(message)s',
+        handlers=[QueueHandler(log_queue)],
+        force=True
+    )
 
 def initialize_components(cfg: Dict[str, Any], repo_dir: Path) -> tuple:
     """
@@ -59,6 +112,15 @@ def initialize_components(cfg: Dict[str, Any], repo_dir: Path) -> tuple:
     Raises:
         AutoBlogError: If component initialization fails
     """
+    # Imported here so feedparser, PIL, GitPython and the Google API client
+    # are only loaded once the configuration has been validated
+    from .rss_fetcher import RSSFetcher, FeedCache
+    from .ai_content import AIFactory, CachedAIGenerator
+    from .image_handler import ImageHandler
+    from .post_generator import PostGenerator
+    from .github_manager import GitHubManager
+    from .scraper.sheets_handler import GoogleSheetsHandler
+    
     try:
         # Initialize GitHub manager
         github_manager = GitHubManager(
@@ -73,9 +135,6 @@ def initialize_components(cfg: Dict[str, Any], repo_dir: Path) -> tuple:
         if not github_manager.ensure_repo_exists():
             raise AutoBlogError("Failed to ensure GitHub repository exists")
         
-        if not github_manager.pull_latest_changes():
-            raise AutoBlogError("Failed to pull latest changes from GitHub")
-        
         # Initialize URL tracking sheet handler
         sheets_handler = GoogleSheetsHandler(
             credentials_file=cfg.get('google_credentials_file'),
@@ -84,18 +143,24 @@ def initialize_components(cfg: Dict[str, Any], repo_dir: Path) -> tuple:
         )
         
         # Initialize post history tracker
-        history_file = Path(__file__).parent.parent / "data" / "post_history.json"
+        history_file = config.PROJECT_ROOT / "data" / "post_history.json"
         post_history = PostHistory(str(history_file))
         post_history.clean_old_entries()
         
-        # Initialize RSS fetcher
+        # Initialize RSS fetcher; unchanged feeds are re-read from the cache
+        feed_cache = None
+        if cfg.get('feed_cache_enabled'):
+            feed_cache = FeedCache(str(config.PROJECT_ROOT / "data" / "feed_cache.sqlite3"))
         rss_fetcher = RSSFetcher(
             rss_urls=cfg['rss_feeds'],
             max_items_per_feed=cfg['max_rss_items'],
             max_age_days=cfg['max_article_age_days'],
             feed_timeout=15,
             article_timeout=8,
-            known_problematic_feeds=[]
+            known_problematic_feeds=[],
+            max_workers=cfg.get('rss_fetch_workers', 8),
+            max_per_host=cfg.get('rss_max_per_host', 2),
+            feed_cache=feed_cache
         )
         
         # Initialize AI content generator
@@ -111,13 +176,22 @@ def initialize_components(cfg: Dict[str, Any], repo_dir: Path) -> tuple:
             openai_model = os.getenv('OPENAI_MODEL', 'gpt-4o-mini')
             ai_generator = ai_factory.create_generator('openai', openai_api_key, openai_model)
         
+        # Reuse earlier responses for re-syndicated articles
+        if cfg.get('ai_cache_enabled'):
+            ai_generator = CachedAIGenerator(
+                ai_generator,
+                str(config.PROJECT_ROOT / "data" / "ai_cache.sqlite3"),
+                ttl_days=cfg.get('ai_cache_ttl_days', 30),
+                similarity_threshold=cfg.get('ai_cache_similarity', 0.9)
+            )
+        
         # Initialize image handler and post generator
         images_dir = Path(repo_dir) / "assets" / "images"
         posts_dir = Path(repo_dir) / "_posts"
         os.makedirs(images_dir, exist_ok=True)
         os.makedirs(posts_dir, exist_ok=True)
         
-        image_handler = ImageHandler(str(images_dir))
+        image_handler = ImageHandler(str(images_dir), session=get_session())
         post_generator = PostGenerator(
             posts_dir=str(posts_dir),
             site_url=f"https://{cfg['github_username']}.github.io/{cfg['github_repo']}",
@@ -142,60 +216,48 @@ def filteredContent(content: str) -> str:
         Filtered content string
     """
     try:
-        # Remove tag like [STRING](URL) non http links
-        # This regex matches markdown links that do not start with http
-        content = re.sub(r'\[([^\]]+)\]\((?!http)[^\)]+\)', '', content)
-
-        # Remove example.com links completely, including brackets if applied
-        content = re.sub(r'\[([^\]]+)\]\(https?://(?:www\.)?example\.com\)', r'\1', content)
-        content = re.sub(r'\bhttps?://(?:www\.)?example\.com\b', '', content)
+        # In one pass: remove ``` blocks (including optional "markdown" after ```),
+        # remove [STRING](URL) links whose URL does not start with http, and
+        # remove example.com links, keeping the text of markdown ones.
+        # Substring checks skip the regex scans for clean content
+        if '```' in content or '](' in content or 'example.com' in content:
+            content = _RE_FILTER.sub(_filter_match, content)
 
         # Also replace link text with correct replacement
-        content = re.sub(
-            r'\[link text\]\((https?://[^\)]+)\)',
-            r'[\1](\1)',
-            content
-        )
-
-        # Remove ``` blocks, including optional "markdown" after ```
-        content = re.sub(r'```(?:markdown)?[\s\S]*?```', '', content)
+        if '[link text](' in content:
+            content = _RE_LINKTEXT.sub(r'[\1](\1)', content)
         
         # Replace specific unwanted phrases
-        replacements = {
-            "Engadget is a web magazine with obsessive daily coverage of everything new in gadgets and consumer electronics": "Engadget",
-            "Ars Technica - All content": "Ars Technica"
-        }
-        
-        for old, new in replacements.items():
+        for old, new in _CONTENT_REPLACEMENTS.items():
             content = content.replace(old, new)
         
         return content.strip()
     
     except Exception as e:
         raise JSONParsingError(f"Failed to filter content: {str(e)}")
-import re
 
-def process_rss_item(item: Any, ai_generator: Any, image_handler: Any, 
-                    post_generator: Any, post_history: Any) -> Optional[tuple]:
+def generate_rss_item(item: Any, ai_generator: Any, image_handler: Any,
+                      post_generator: Any = None) -> Optional[tuple]:
     """
-    Process a single RSS item into a blog post.
+    Generate the blog content and featured image for a single RSS item.
+    This is the slow, network-bound stage of processing an item.
     
     Args:
         item: RSS feed item
         ai_generator: AI content generator
         image_handler: Image handler
-        post_generator: Post generator
-        post_history: Post history tracker
+        post_generator: Post generator used to skip posts that already exist (optional)
         
     Returns:
-        Tuple of post path and automation data or None if processing failed or content not relevant
+        Tuple of generated content (with its content already filtered) and image
+        path, or None if content not relevant, too short after filtering, or a
+        post with the same slug already exists
         
     Raises:
         ContentGenerationError: If AI content generation fails
         ImageProcessingError: If image processing fails
-        PostCreationError: If post creation fails
     """
-    logger.info(f"Processing item: {item.title}")
+    logger.info("Processing item: %s", item.title)
     
     try:
         # Prepare article data for AI
@@ -219,21 +281,64 @@ def process_rss_item(item: Any, ai_generator: Any, image_handler: Any,
         
         # Check if content is relevant to our niche
         if not generated_content.get('relevant_to_niche', True):
-            logger.info(f"Article '{item.title}' not relevant to niche, skipping")
+            logger.info("Article '%s' not relevant to niche, skipping", item.title)
+            return None
+        
+        # Post history is local, so a run on another machine may already have
+        # published this post; skip it before downloading the image
+        if post_generator is not None and post_generator.post_exists(generated_content.get('title', '')):
+            logger.info("Post for '%s' already exists, skipping", item.title)
             return None
         
+        # Filter the content now so an unusable post is rejected before its
+        # image is downloaded
+        md_content = filteredContent(generated_content.get('content', ''))
+        if len(md_content) < MIN_CONTENT_LENGTH:
+            logger.info("Content for '%s' too short after filtering (%d chars), skipping",
+                        item.title, len(md_content))
+            return None
+        generated_content = {**generated_content, 'content': md_content}
+        
         # Process image if available
         image_path = None
         if item.image_url:
             try:
-                image_path = image_handler.download_image(item.image_url, item.title)
-                if image_path:
-                    image_path = image_handler.resize_image(image_path, max_width=1200)
+                image_path = image_handler.download_and_resize(
+                    item.image_url, item.title, max_width=1200
+                )
             except Exception as e:
-                logger.warning(f"Image processing failed, continuing without image: {str(e)}")
+                logger.warning("Image processing failed, continuing without image: %s", e)
+        
+        return (generated_content, image_path)
+        
+    except (ContentGenerationError, ImageProcessingError) as e:
+        logger.error("Failed to process item %s: %s", item.title, e)
+        raise
+    except Exception as e:
+        raise AutoBlogError(f"Unexpected error processing item {item.title}: {str(e)}")
+
+def publish_rss_item(item: Any, generated_content: Dict[str, Any], image_path: Optional[str],
+                     post_generator: Any) -> tuple:
+    """
+    Write the blog post for an RSS item from its generated content.
+    
+    Args:
+        item: RSS feed item
+        generated_content: Content returned by generate_rss_item
+        image_path: Path to the featured image, if any
+        post_generator: Post generator
         
+    Returns:
+        Tuple of post path and automation data
+        
+    Raises:
+        ImageProcessingError: If image processing fails
+        PostCreationError: If post creation fails
+    """
+    try:
         # Create post
-        mdContent = filteredContent(generated_content.get('content', ''))
+        # Content was already filtered by generate_rss_item
+        mdContent = generated_content.get('content', '')
         sourceName = filteredContent(item.source_name)
         post_path, automationData = post_generator.create_post(
             content_data={
@@ -248,21 +353,98 @@ def process_rss_item(item: Any, ai_generator: Any, image_handler: Any,
             },
             image_path=image_path
         )
-    
         
         return (post_path, automationData)
         
-    except (ContentGenerationError, ImageProcessingError, PostCreationError) as e:
-        logger.error(f"Failed to process item {item.title}: {str(e)}")
+    except (ImageProcessingError, PostCreationError) as e:
+        logger.error("Failed to process item %s: %s", item.title, e)
         raise
     except Exception as e:
         raise AutoBlogError(f"Unexpected error processing item {item.title}: {str(e)}")
 
+def process_rss_item(item: Any, ai_generator: Any, image_handler: Any, 
+                    post_generator: Any, post_history: Any) -> Optional[tuple]:
+    """
+    Process a single RSS item into a blog post.
+    
+    Args:
+        item: RSS feed item
+        ai_generator: AI content generator
+        image_handler: Image handler
+        post_generator: Post generator
+        post_history: Post history tracker
+        
+    Returns:
+        Tuple of post path and automation data or None if processing failed or content not relevant
+        
+    Raises:
+        ContentGenerationError: If AI content generation fails
+        ImageProcessingError: If image processing fails
+        PostCreationError: If post creation fails
+    """
+    generated = generate_rss_item(item, ai_generator, image_handler, post_generator)
+    if generated is None:
+        return None
+    
+    generated_content, image_path = generated
+    return publish_rss_item(item, generated_content, image_path, post_generator)
+
+def generate_items(items: Iterator[tuple], items_lock: threading.Lock, ai_generator: Any,
+                   image_handler: Any, post_generator: Any, demand: threading.Semaphore,
+                   done: threading.Event, results: queue.Queue, num_posts: int,
+                   retry_delay: float = 5) -> None:
+    """
+    Producer stage of the post pipeline.
+    Generates content for items on demand and queues the results for the writer.
+    Several producers may share one item iterator; results are queued as each
+    item finishes, so a slow item does not hold up the others.
+    
+    Args:
+        items: Shared iterator over (attempt, item) pairs of candidate RSS items
+        items_lock: Lock guarding access to the shared iterator
+        ai_generator: AI content generator
+        image_handler: Image handler
+        post_generator: Post generator used to skip existing posts, or None to regenerate them
+        demand: Semaphore released by the writer whenever another item is needed
+        done: Event set by the writer once enough posts have been written
+        results: Queue receiving (item, generated, error) tuples, then None when finished
+        num_posts: Number of posts requested; items beyond this are retries
+        retry_delay: Seconds to wait before generating a retry item
+    """
+    try:
+        while True:
+            demand.acquire()
+            if done.is_set():
+                break
+            
+            with items_lock:
+                next_item = next(items, None)
+            if next_item is None:
+                # Pass the wake-up on: producers still waiting for demand
+                # would otherwise never learn the items have run out, and the
+                # writer waits for every producer to finish
+                demand.release()
+                break
+            
+            attempt, item = next_item
+            if attempt >= num_posts:
+                logger.info("Retrying with new item after delay (attempt %d)", attempt + 1)
+                time.sleep(retry_delay)
+            
+            try:
+                results.put((item, generate_rss_item(item, ai_generator, image_handler,
+                                                       post_generator), None))
+            except Exception as e:
+                results.put((item, None, e))
+    finally:
+        results.put(None)
+
 def main():
     """
     Main function to run the automated blog system.
     Fetches RSS feeds, generates blog posts with AI, and pushes to GitHub repository.
     """
+    setup_logging()
     logger.info("Starting automated blog system")
     
     try:
@@ -270,111 +452,159 @@ def main():
         errors = config.validate_config()
         if errors:
             for error in errors:
-                logger.error(f"Configuration error: {error}")
+                logger.error("Configuration error: %s", error)
             sys.exit(1)
         
         # Get configuration
         cfg = config.get_config()
-        repo_dir = Path(__file__).parent.parent / "github_repo"
+        repo_dir = config.PROJECT_ROOT / "github_repo"
         
         # Initialize components
         (github_manager, post_history, rss_fetcher, ai_generator,
          image_handler, post_generator, sheets_handler) = initialize_components(cfg, repo_dir)
         
-        # Fetch RSS feeds
-        all_items = rss_fetcher.fetch_all_feeds()
-        logger.info(f"Fetched {len(all_items)} items from RSS feeds")
+        # Pull the blog repository, fetch RSS feeds and read the tracking sheet
+        # concurrently; they are independent network calls
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            pull_future = executor.submit(github_manager.pull_latest_changes)
+            feeds_future = executor.submit(rss_fetcher.fetch_all_feeds)
+            sheet_future = executor.submit(sheets_handler.get_processed_urls)
+        
+        if not pull_future.result():
+            raise AutoBlogError("Failed to pull latest changes from GitHub")
+        
+        all_items = feeds_future.result()
+        logger.info("Fetched %d items from RSS feeds", len(all_items))
 
-        # Get processed URLs from Google Sheet
-        processed_urls = sheets_handler.get_processed_urls()
-        logger.info(f"Got {len(processed_urls)} processed URLs from tracking sheet")
-        
-        # Filter out items that have been processed
-        unprocessed_items = [
-            item for item in all_items 
-            if item.link not in processed_urls
-        ]
-        logger.info(f"{len(unprocessed_items)} items remaining after filter")
+        processed_urls = sheet_future.result()
+        logger.info("Got %d processed URLs from tracking sheet", len(processed_urls))
+        
+        # Build the lookup set once so filtering is a hash check per item
+        seen_urls = set(processed_urls).union(post_history.as_set())
+        
+        # Filter out items that have been processed, and keep only the first
+        # item for a link that several feeds syndicate
+        unprocessed_items = []
+        for item in all_items:
+            if item.link not in seen_urls:
+                seen_urls.add(item.link)
+                unprocessed_items.append(item)
+        logger.info("%d items remaining after filter", len(unprocessed_items))
                 
         if not unprocessed_items:
             logger.info("No new articles to process")
             return
         
         # Determine number of posts to generate
+        from dotenv import load_dotenv
         load_dotenv(override=True)
         try:
             posts_per_day = int(os.getenv('POSTS_PER_DAY', '1'))
         except (ValueError, TypeError):
             posts_per_day = 1
-            logger.warning(f"Using default posts_per_day: {posts_per_day}")
+            logger.warning("Using default posts_per_day: %s", posts_per_day)
         
         num_posts = min(len(unprocessed_items), posts_per_day)
         created_post_paths = []
         processed_urls = []
         automation_payloads = []
         
-        # Process items and create posts with retry logic
-        current_item_idx = 0
-        successfully_processed = 0
+        # Generation (AI + image) runs on producer threads while this thread
+        # writes finished posts in completion order, so one slow item does
+        # not hold up the rest
+        results = queue.Queue()
+        demand = threading.Semaphore(num_posts)
+        done = threading.Event()
+        items = enumerate(unprocessed_items)
+        items_lock = threading.Lock()
+        # Bounded separately so large batches don't exceed the provider's rate limits
+        num_workers = min(num_posts, cfg.get('ai_concurrency', 4))
+        producers = [
+            threading.Thread(
+                target=generate_items,
+                args=(items, items_lock, ai_generator, image_handler,
+                      None if cfg.get('force_regenerate') else post_generator,
+                      demand, done, results, num_posts),
+                daemon=True
+            )
+            for _ in range(num_workers)
+        ]
+        for producer in producers:
+            producer.start()
         
-        while successfully_processed < num_posts and current_item_idx < len(unprocessed_items):
-            max_retries = 2  # Maximum number of retries per post
-            retry_count = 0
-            success = False
-            
-            while not success and retry_count < max_retries:
-                if current_item_idx >= len(unprocessed_items):
+        successfully_processed = 0
+        finished_workers = 0
+        while successfully_processed < num_posts:
+            result = results.get()
+            if result is None:
+                finished_workers += 1
+                if finished_workers == num_workers:
                     logger.warning("Ran out of unprocessed items to try")
                     break
-                    
-                item = unprocessed_items[current_item_idx]
-                current_item_idx += 1
+                continue
+            
+            item, generated, error = result
+            try:
+                if error is not None:
+                    raise error
+                
+                if generated is None:
+                    logger.info("Item %s was skipped, trying another", item.title)
+                    demand.release()
+                    continue
                 
-                if retry_count > 0:
-                    logger.info(f"Retrying with new item after delay (attempt {retry_count+1})")
-                    time.sleep(5)  # Delay for 5 seconds between retries
+                generated_content, image_path = generated
+                post_path, automationData = publish_rss_item(
+                    item, generated_content, image_path, post_generator
+                )
+                created_post_paths.append(post_path)
+                processed_urls.append(item.link)
+                automation_payloads.append(automationData)
+                successfully_processed += 1
+                logger.info("Successfully processed item %s", item.title)
                 
-                try:
-                    result = process_rss_item(
-                        item, ai_generator, image_handler, post_generator, post_history
-                    )
-                    
-                    if result:  # Post was successfully created and is relevant
-                        post_path, automationData = result
-                        created_post_paths.append(post_path)
-                        processed_urls.append(item.link)
-                        automation_payloads.append(automationData)
-                        success = True
-                        successfully_processed += 1
-                        logger.info(f"Successfully processed item {item.title}")
-                    else:
-                        logger.info(f"Item {item.title} was not relevant, trying another")
-                        retry_count += 1
-                        
-                except AutoBlogError as e:
-                    logger.error(f"Failed to process item: {str(e)}")
-                    retry_count += 1
+            except AutoBlogError as e:
+                logger.error("Failed to process item: %s", e)
+                demand.release()
+        
+        # Let the producers exit instead of generating more items
+        done.set()
+        for _ in range(num_workers):
+            demand.release()
+        for producer in producers:
+            producer.join()
+        
+        # Post files are written in the background; they must be on disk
+        # before they are committed. A post whose file could not be written
+        # is dropped, so its URL can be picked up again on the next run
+        failed_paths = set(post_generator.close())
+        if failed_paths:
+            kept = [i for i, path in enumerate(created_post_paths) if path not in failed_paths]
+            created_post_paths = [created_post_paths[i] for i in kept]
+            processed_urls = [processed_urls[i] for i in kept]
+            automation_payloads = [automation_payloads[i] for i in kept]
+        for url in processed_urls:
+            post_history.mark_as_processed(url)
         
         # Update post history and commit changes
         if processed_urls:
-            current_date = datetime.now().strftime('%Y-%m-%d')
-            commit_message = f"Add {len(created_post_paths)} new blog post(s) for {current_date}"
+            commit_message = f"Add {len(created_post_paths)} new blog post(s) for {RUN_DATE}"
             
             if not github_manager.commit_and_push_changes(commit_message):
                 logger.error("Failed to commit and push changes")
                 return
 
-            # Add processed URLs to tracking sheet
-            for url in processed_urls:
-                sheets_handler.add_processed_url(url)
+            # Persist the URLs marked above, then record them in the tracking sheet
+            post_history.flush()
+            sheets_handler.add_processed_urls(processed_urls)
 
         logger.info("Automated blog system completed successfully")
         
     except AutoBlogError as e:
-        logger.error(f"System error: {str(e)}")
+        logger.error("System error: %s", e)
         sys.exit(1)
     except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
+        logger.error("Unexpected error: %s", e)
         sys.exit(1)
 
 if __name__ == "__main__":
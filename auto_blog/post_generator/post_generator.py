@@ -3,17 +3,162 @@ Post generator implementation for creating Jekyll-compatible blog posts.
 """
 import os
 import re
+import json
 import random
 import logging
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
-import yaml
 import shutil
 from ..utils.exceptions import PostCreationError, ImageProcessingError, ZapierError
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
 logger = logging.getLogger(__name__)
 
+# ioctl request that makes a file share another file's extents (Linux reflink)
+FICLONE = 0x40049409
+
+# Slug normalization patterns, shared by post slugs and tags
+_SLUG_STRIP_RE = re.compile(r'[^\w\s-]')
+_SLUG_SEPARATOR_RE = re.compile(r'[\s_-]+')
+_SLUG_DASHES_RE = re.compile(rb'-+')
+
+# ASCII equivalents of the patterns above for bytes.translate, which runs as a
+# single table lookup per byte: characters that are not word characters,
+# whitespace or hyphens are deleted, and whitespace and '_' map to '-'
+_SLUG_ASCII_WHITESPACE = bytes(c for c in range(128) if chr(c).isspace())
+_SLUG_ASCII_DELETE = bytes(
+    c for c in range(128)
+    if not (chr(c).isalnum() or chr(c).isspace() or chr(c) in '_-')
+)
+_SLUG_ASCII_SEPARATORS = bytes.maketrans(
+    _SLUG_ASCII_WHITESPACE + b'_', b'-' * (len(_SLUG_ASCII_WHITESPACE) + 1)
+)
+
+@lru_cache(maxsize=2048)
+def _slugify(text: str) -> str:
+    """
+    Lowercase text and reduce it to word characters separated by single hyphens.
+    Memoized: a title is slugified by post_exists and again by create_post,
+    and the same AI-suggested tags recur across posts.
+    
+    Args:
+        text: Text to convert
+        
+    Returns:
+        The slugified text
+    """
+    text = text.lower()
+    if text.isascii():
+        data = text.encode('ascii').translate(None, _SLUG_ASCII_DELETE).strip(_SLUG_ASCII_WHITESPACE)
+        return _SLUG_DASHES_RE.sub(b'-', data.translate(_SLUG_ASCII_SEPARATORS)).decode('ascii')
+    # Unicode word characters and whitespace need the regex classes
+    text = _SLUG_STRIP_RE.sub('', text)
+    return _SLUG_SEPARATOR_RE.sub('-', text.strip())
+
+# Characters YAML does not accept literally inside a double-quoted scalar
+_YAML_UNSAFE_RE = re.compile('[\x7f-\x9f\u2028\u2029\ufeff\ufffe\uffff]')
+
+def _yaml_quote(value: str) -> str:
+    """
+    Quote a string as a YAML double-quoted scalar.
+    JSON string escapes are a subset of YAML's, so json.dumps does the work.
+    
+    Args:
+        value: The string to quote
+        
+    Returns:
+        Quoted scalar
+    """
+    quoted = json.dumps(value, ensure_ascii=False)
+    return _YAML_UNSAFE_RE.sub(lambda m: f"\\u{ord(m.group()):04x}", quoted)
+
+def _yaml_scalar(value: Any) -> Optional[str]:
+    """
+    Format a simple value as a YAML scalar.
+    
+    Args:
+        value: The value to format
+        
+    Returns:
+        YAML scalar text, or None if the value is not a simple scalar
+    """
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, str):
+        return _yaml_quote(value)
+    if isinstance(value, int):
+        return str(value)
+    return None
+
+def _fast_place_image(src: str, dst: str) -> str:
+    """
+    Place an image at dst as cheaply as the filesystem allows: a hard link,
+    then a reflink (copy-on-write clone), then a kernel-side copy.
+    
+    Args:
+        src: Source image path
+        dst: Destination path, which must not exist yet
+        
+    Returns:
+        How the image was placed ('Linked', 'Reflinked' or 'Copied')
+        
+    Raises:
+        FileExistsError: If dst already exists
+        OSError: If the image cannot be copied
+    """
+    try:
+        os.link(src, dst)
+        return 'Linked'
+    except FileExistsError:
+        raise
+    except OSError:
+        pass
+    
+    if fcntl is not None:
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        try:
+            with open(src, 'rb') as src_file:
+                fcntl.ioctl(dst_fd, FICLONE, src_file.fileno())
+            return 'Reflinked'
+        except OSError:
+            os.close(dst_fd)
+            dst_fd = None
+            os.remove(dst)
+        finally:
+            if dst_fd is not None:
+                os.close(dst_fd)
+    
+    shutil.copyfile(src, dst)
+    return 'Copied'
+
+def _write_atomic(filepath: str, payload: bytes) -> None:
+    """
+    Write a file through a temporary sibling so readers never see a partial post.
+    
+    Args:
+        filepath: Destination path
+        payload: File contents
+    """
+    tmp_path = f"{filepath}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        # Don't leave a stray .tmp in _posts for the next commit to pick up
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
 class PostGenerator:
     """
     Generates Jekyll-compatible blog posts from AI-generated content.
@@ -21,7 +166,7 @@ class PostGenerator:
     
     def __init__(self, posts_dir: str, site_url: str, author_name: str, 
                  image_dir: str, available_categories: List[str],
-                 available_tags: List[str]):
+                 available_tags: List[str], random_seed: Optional[int] = None):
         """
         Initialize the post generator.
         
@@ -32,6 +177,7 @@ class PostGenerator:
             image_dir: Directory where images are stored
             available_categories: List of available categories for the blog
             available_tags: List of available tags for the blog
+            random_seed: Seed for category and tag selection (optional)
             
         Raises:
             PostCreationError: If directories cannot be created
@@ -42,11 +188,26 @@ class PostGenerator:
         self.image_dir = image_dir
         self.available_categories = available_categories
         self.available_tags = available_tags
+        # Categories and lowercased tags are used on every post; prepare them once
+        self._categories_tuple = tuple(available_categories)
+        self._available_tags_lower = [tag.lower() for tag in available_tags]
+        self._available_tags_lower_set = set(self._available_tags_lower)
+        self._tag_pairs = tuple(zip(available_tags, self._available_tags_lower))
+        # Own generator so concurrent posts don't share the module-level one
+        self._rng = random.Random(random_seed)
+        # Slugs of posts already in posts_dir, loaded on first use
+        self._existing_slugs = None
+        # Featured images are placed here, next to the posts directory
+        self._assets_img_dir = os.path.abspath(os.path.join(os.path.dirname(self.posts_dir), "assets/images"))
+        # Post files are written in the background; flush() waits for them
+        self._write_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="post-writer")
+        self._pending_writes: List[Tuple[str, Future, Optional[str]]] = []
         
-        # Create the posts directory if it doesn't exist
+        # Create the posts and images directories if they don't exist
         try:
             os.makedirs(self.posts_dir, exist_ok=True)
-            logger.info(f"Post generator initialized with directory: {self.posts_dir}")
+            os.makedirs(self._assets_img_dir, exist_ok=True)
+            logger.info("Post generator initialized with directory: %s", self.posts_dir)
         except OSError as e:
             raise PostCreationError(f"Failed to create posts directory: {str(e)}")
     
@@ -74,18 +235,20 @@ class PostGenerator:
                 raise PostCreationError("Cannot create post: missing title or content")
             
             # Generate filename with date and slug
-            date = datetime.now()
-            date_str = date.strftime('%Y-%m-%d')
-            time_str = date.strftime('%H:%M:%S %z')
-            slug = self._generate_slug(title)
+            # Format the local time with its UTC offset once; the filename
+            # date is sliced from the same string
+            datetime_str = datetime.now().astimezone().isoformat(sep=' ', timespec='seconds')
+            date_str = datetime_str[:10]
+            slug = self.compute_slug(title)
             filename = f"{date_str}-{slug}.md"
             filepath = os.path.join(self.posts_dir, filename)
             
             # Handle image processing
             image_relative_path = None
+            image_file = None
             if image_path:
                 try:
-                    image_relative_path = self._process_image(image_path)
+                    image_relative_path, image_file = self._process_image(image_path)
                 except Exception as e:
                     raise ImageProcessingError(f"Failed to process image: {str(e)}")
             
@@ -95,8 +258,7 @@ class PostGenerator:
             # Prepare frontmatter
             frontmatter = self._prepare_frontmatter(
                 title=title,
-                date_str=date_str,
-                time_str=time_str,
+                datetime_str=datetime_str,
                 description=content_data.get('meta_description', ''),
                 image_path=image_relative_path,
                 tags=processed_tags,
@@ -113,13 +275,16 @@ class PostGenerator:
             
             # Write post content
             try:
-                self._write_post_file(filepath, frontmatter, content)
+                self._write_post_file(filepath, frontmatter, content, image_file)
+                if self._existing_slugs is not None:
+                    self._existing_slugs.add(slug)
 
                 # Prepare automation data (do not send here)
-                post_link = f"{os.getenv('SITE_URL')}{f'/{frontmatter['categories'][0]}' if frontmatter.get('categories') else ''}/{slug}"
-                image_path_full = (f"{os.getenv('SITE_URL')}{image_relative_path}").lower() if image_relative_path else None
+                site_url = os.getenv('SITE_URL')
+                post_link = f"{site_url}{f'/{frontmatter['categories'][0]}' if frontmatter.get('categories') else ''}/{slug}"
+                image_path_full = (f"{site_url}{image_relative_path}").lower() if image_relative_path else None
                 automationData = {
-                    "site_url": os.getenv("SITE_URL"),
+                    "site_url": site_url,
                     "title": title,
                     "description": content_data.get('meta_description', ''),
                     "post_slug": slug,
@@ -159,7 +324,7 @@ class PostGenerator:
             return ''
         return ' '.join(['#' + tag.strip('#').lower() for tag in tags])
 
-    def _process_image(self, image_path: str) -> Optional[str]:
+    def _process_image(self, image_path: str) -> Tuple[str, Optional[str]]:
         """
         Process and move image to assets directory.
         
@@ -167,7 +332,8 @@ class PostGenerator:
             image_path: Path to the source image
             
         Returns:
-            Relative path to the processed image
+            Tuple of the relative path to the processed image and the path of
+            the image file added for this post (None if it was already there)
             
         Raises:
             ImageProcessingError: If image processing fails
@@ -175,31 +341,33 @@ class PostGenerator:
         try:
             # Get image name and prepare paths
             image_name = os.path.basename(image_path)
-            assets_img_dir = os.path.join(os.path.dirname(self.posts_dir), "assets/images")
-            os.makedirs(assets_img_dir, exist_ok=True)
-            
-            target_image_path = os.path.join(assets_img_dir, image_name)
+            target_image_path = os.path.join(self._assets_img_dir, image_name)
             
-            # Only copy if source and destination are different
-            if os.path.abspath(image_path) != os.path.abspath(target_image_path):
-                shutil.copy2(image_path, target_image_path)
-                logger.info(f"Copied image to {target_image_path}")
+            # Only place the image if source and destination are different
+            added_image_path = target_image_path
+            if os.path.abspath(image_path) != target_image_path:
+                try:
+                    method = _fast_place_image(image_path, target_image_path)
+                    logger.info("%s image to %s", method, target_image_path)
+                except FileExistsError:
+                    logger.info("Image already present at %s", target_image_path)
+                    added_image_path = None
             
-            return f"/assets/images/{image_name}"
+            return f"/assets/images/{image_name}", added_image_path
             
         except Exception as e:
             raise ImageProcessingError(f"Image processing failed: {str(e)}")
 
-    def _prepare_frontmatter(self, title: str, date_str: str, time_str: str,
+    def _prepare_frontmatter(self, title: str, datetime_str: str,
                            description: str, image_path: Optional[str],
                            tags: List[str], categories: List[str], keywords: List[str]) -> Dict[str, Any]:
         """Prepare post frontmatter."""
         frontmatter = {
             'title': title,
-            'date': f"{date_str} {time_str}",
+            'date': datetime_str,
             'categories': self._select_categories(max_categories=1, categories=categories),
             'tags': tags,
-            'excerpt': description if description else f"{' '.join(title.split()[:10])}...",
+            'excerpt': description if description else f"{' '.join(title.split(maxsplit=10)[:10])}...",
             'toc': True,
             'toc_sticky': True,
             'classes': 'wide',
@@ -211,18 +379,109 @@ class PostGenerator:
         
         return frontmatter
 
-    def _write_post_file(self, filepath: str, frontmatter: Dict[str, Any], content: str) -> None:
-        """Write post content to file with proper formatting."""
+    def _emit_frontmatter(self, frontmatter: Dict[str, Any]) -> str:
+        """
+        Emit frontmatter as block-style YAML, keeping key order.
+        Strings, booleans, integers, lists of scalars and mappings of scalars are
+        formatted directly; anything else goes through PyYAML.
+        
+        Args:
+            frontmatter: The frontmatter mapping
+            
+        Returns:
+            YAML text ending with a newline
+        """
+        lines = []
+        for key, value in frontmatter.items():
+            scalar = _yaml_scalar(value)
+            if scalar is not None:
+                lines.append(f"{key}: {scalar}")
+                continue
+            
+            if isinstance(value, (list, tuple)):
+                items = [_yaml_scalar(item) for item in value]
+                if None not in items:
+                    if items:
+                        lines.append(f"{key}:")
+                        lines.extend(f"- {item}" for item in items)
+                    else:
+                        lines.append(f"{key}: []")
+                    continue
+            elif isinstance(value, dict):
+                entries = [(sub_key, _yaml_scalar(sub_value)) for sub_key, sub_value in value.items()]
+                if entries and all(isinstance(sub_key, str) and sub_value is not None
+                                   for sub_key, sub_value in entries):
+                    lines.append(f"{key}:")
+                    lines.extend(f"  {sub_key}: {sub_value}" for sub_key, sub_value in entries)
+                    continue
+            
+            # Rarely needed, so PyYAML is only imported on first use; the
+            # libyaml emitter is used when PyYAML was built with it
+            import yaml
+            dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+            lines.append(yaml.dump({key: value}, Dumper=dumper, default_flow_style=False,
+                                   sort_keys=False, allow_unicode=True).rstrip('\n'))
+        
+        return '\n'.join(lines) + '\n'
+
+    def _write_post_file(self, filepath: str, frontmatter: Dict[str, Any], content: str,
+                         image_file: Optional[str] = None) -> None:
+        """
+        Format the post and queue it to be written; flush() waits for the write.
+        
+        Args:
+            filepath: Destination path of the post
+            frontmatter: Post frontmatter
+            content: Post body
+            image_file: Image file added for the post, removed if the write fails
+        """
         try:
-            frontmatter_yaml = yaml.dump(frontmatter, default_flow_style=False, 
-                                       sort_keys=False, allow_unicode=True)
+            frontmatter_yaml = self._emit_frontmatter(frontmatter)
             post_content = f"---\n{frontmatter_yaml}---\n\n{content}"
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(post_content)
+            future = self._write_pool.submit(_write_atomic, filepath, post_content.encode('utf-8'))
+            self._pending_writes.append((filepath, future, image_file))
         except Exception as e:
             raise PostCreationError(f"Failed to write post file: {str(e)}")
 
+    def flush(self) -> List[str]:
+        """
+        Wait for all queued post files to be written.
+        
+        The images added for posts that could not be written are removed, so
+        they are not committed without a post referencing them.
+        
+        Returns:
+            Paths of the post files that could not be written
+        """
+        pending, self._pending_writes = self._pending_writes, []
+        failed = []
+        for filepath, future, image_file in pending:
+            try:
+                future.result()
+            except Exception as e:
+                logger.error("Failed to write post file %s: %s", filepath, e)
+                failed.append(filepath)
+                if image_file:
+                    try:
+                        os.unlink(image_file)
+                    except OSError as unlink_error:
+                        logger.warning("Could not remove image %s of unwritten post: %s",
+                                       image_file, unlink_error)
+        return failed
+
+    def close(self) -> List[str]:
+        """
+        Wait for queued post files and stop the writer threads.
+        
+        Returns:
+            Paths of the post files that could not be written
+        """
+        try:
+            return self.flush()
+        finally:
+            self._write_pool.shutdown(wait=True)
+
     def _add_source_attribution(self, content: str, source_url: Optional[str], 
                               source_name: Optional[str]) -> str:
         """Add source attribution to post content."""
@@ -233,6 +492,41 @@ class PostGenerator:
                 content += f"\n\n---\n\nSource: [Original Article]({source_url})"
         return content
 
+    def compute_slug(self, title: str) -> str:
+        """
+        Compute the slug used in a post's filename and permalink.
+        
+        Args:
+            title: The post title
+            
+        Returns:
+            A URL-friendly slug
+        """
+        return self._generate_slug(title)
+    
+    def post_exists(self, title: str) -> bool:
+        """
+        Check whether a post with this title's slug is already in the posts directory,
+        regardless of the date it was published on.
+        
+        Args:
+            title: The post title
+            
+        Returns:
+            True if a post with the same slug exists, False otherwise
+        """
+        if self._existing_slugs is None:
+            try:
+                # Filenames are YYYY-MM-DD-<slug>.md
+                self._existing_slugs = {
+                    name[11:-3] for name in os.listdir(self.posts_dir)
+                    if name.endswith('.md') and len(name) > 14
+                }
+            except OSError as e:
+                logger.warning("Could not list existing posts: %s", e)
+                return False
+        return self.compute_slug(title) in self._existing_slugs
+    
     def _generate_slug(self, title: str) -> str:
         """
         Generate a slug from the post title.
@@ -243,12 +537,8 @@ class PostGenerator:
         Returns:
             A URL-friendly slug
         """
-        # Remove special characters and replace spaces with hyphens
-        slug = re.sub(r'[^\w\s-]', '', title.lower())
-        slug = re.sub(r'[\s_-]+', '-', slug.strip())
-        
-        # Limit length
-        return slug[:50]
+        # Remove special characters, replace spaces with hyphens and limit length
+        return _slugify(title)[:50]
     
     def _select_categories(self, max_categories: int = 2, categories: List[str] = []) -> List[str]:
         """
@@ -262,9 +552,9 @@ class PostGenerator:
         """
         num_categories = min(max_categories, len(self.available_categories))
         if categories:
-            return random.sample(categories, num_categories)
+            return self._rng.sample(categories, num_categories)
         else:
-            return random.sample(self.available_categories, num_categories)
+            return self._rng.sample(self._categories_tuple, num_categories)
     
     def _process_tags(self, suggested_tags: List[str], max_tags: int = 5) -> List[str]:
         """
@@ -279,9 +569,7 @@ class PostGenerator:
         """
         # Filter out invalid tags and convert to lowercase
         processed_tags = []
-        
-        # First add tags that match our available tags
-        available_tags_lower = [tag.lower() for tag in self.available_tags]
+        selected_lower = set()
         
         for tag in suggested_tags:
             # Skip empty tags
@@ -289,23 +577,23 @@ class PostGenerator:
                 continue
                 
             # Convert to lowercase and remove special characters
-            clean_tag = re.sub(r'[^\w\s-]', '', tag.lower())
-            clean_tag = re.sub(r'[\s_-]+', '-', clean_tag.strip())
+            clean_tag = _slugify(tag)
             
             # If the tag is in our available tags, add it
-            # if clean_tag.lower() in available_tags_lower:
+            # if clean_tag in self._available_tags_lower_set:
             processed_tags.append(clean_tag)
+            selected_lower.add(clean_tag)
         
         # If we don't have enough tags, add some from our available tags
         if len(processed_tags) < max_tags:
             remaining_slots = max_tags - len(processed_tags)
             # Get tags that aren't already selected
-            remaining_tags = [tag for tag in self.available_tags if tag.lower() not in [t.lower() for t in processed_tags]]
+            remaining_tags = [tag for tag, tag_lower in self._tag_pairs if tag_lower not in selected_lower]
             
             if remaining_tags:
                 # Select random tags from remaining available tags
                 num_to_add = min(remaining_slots, len(remaining_tags))
-                processed_tags.extend(random.sample(remaining_tags, num_to_add))
+                processed_tags.extend(self._rng.sample(remaining_tags, num_to_add))
         
         # Limit the number of tags
         return processed_tags[:max_tags]
\ No newline at end of file
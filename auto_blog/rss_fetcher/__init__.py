@@ -4,5 +4,6 @@ Handles fetching and parsing RSS feeds.
 """
 
 from .rss_fetcher import RSSFetcher, RSSItem
+from .feed_cache import FeedCache
 
-__all__ = ['RSSFetcher', 'RSSItem']
+__all__ = ['RSSFetcher', 'RSSItem', 'FeedCache']
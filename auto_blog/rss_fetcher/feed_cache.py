@@ -0,0 +1,130 @@
+"""
+Persistent cache of RSS feed bodies and their HTTP validators.
+Lets feeds be fetched conditionally so an unchanged feed costs a
+304 Not Modified response instead of a full download.
+"""
+
+import os
+import time
+import sqlite3
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class CachedFeed:
+    """A feed body as last downloaded, with the validators sent for it."""
+    body: bytes
+    url: str
+    content_type: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """
+        Build the headers asking the server to skip an unchanged body.
+
+        Returns:
+            If-None-Match / If-Modified-Since headers for the cached validators
+        """
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+class FeedCache:
+    """
+    SQLite-backed store of the last body and ETag/Last-Modified validators
+    of each feed URL. Bodies are kept so a 304 response can be parsed
+    exactly like the original download; feeds without validators are not stored.
+    """
+
+    def __init__(self, db_path: str, ttl_days: int = 30):
+        """
+        Initialize the feed cache.
+
+        Args:
+            db_path: Path to the SQLite cache database
+            ttl_days: Number of days an entry for a feed that is no longer fetched is kept
+        """
+        self.db_path = db_path
+
+        # Feeds are fetched on several threads; the connection is shared behind a lock
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS feeds "
+                "(feed_url TEXT PRIMARY KEY, url TEXT NOT NULL, content_type TEXT NOT NULL, "
+                "etag TEXT, last_modified TEXT, body BLOB NOT NULL, ts REAL NOT NULL)"
+            )
+            self._conn.execute("DELETE FROM feeds WHERE ts < ?", (time.time() - ttl_days * 86400,))
+        logger.info(f"Feed cache enabled at {db_path}")
+
+    def get(self, feed_url: str) -> Optional[CachedFeed]:
+        """
+        Look up the cached copy of a feed.
+
+        Args:
+            feed_url: Configured URL of the feed
+
+        Returns:
+            The cached feed, or None if it has not been stored
+        """
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT body, url, content_type, etag, last_modified FROM feeds WHERE feed_url = ?",
+                    (feed_url,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Feed cache lookup failed for {feed_url}: {str(e)}")
+            return None
+        return CachedFeed(*row) if row else None
+
+    def store(self, feed_url: str, feed: CachedFeed):
+        """
+        Store a downloaded feed, or forget it when the server sent no validators.
+
+        Args:
+            feed_url: Configured URL of the feed
+            feed: The downloaded body and its validators
+        """
+        try:
+            with self._lock, self._conn:
+                if feed.etag or feed.last_modified:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO feeds "
+                        "(feed_url, url, content_type, etag, last_modified, body, ts) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (feed_url, feed.url, feed.content_type, feed.etag,
+                         feed.last_modified, feed.body, time.time())
+                    )
+                else:
+                    self._conn.execute("DELETE FROM feeds WHERE feed_url = ?", (feed_url,))
+        except sqlite3.Error as e:
+            logger.warning(f"Feed cache store failed for {feed_url}: {str(e)}")
+
+    def touch(self, feed_url: str):
+        """
+        Mark a cached feed as confirmed unchanged so it is not expired.
+
+        Args:
+            feed_url: Configured URL of the feed
+        """
+        try:
+            with self._lock, self._conn:
+                self._conn.execute("UPDATE feeds SET ts = ? WHERE feed_url = ?", (time.time(), feed_url))
+        except sqlite3.Error as e:
+            logger.warning(f"Feed cache update failed for {feed_url}: {str(e)}")
+
+    def close(self):
+        """Close the cache database."""
+        with self._lock:
+            self._conn.close()
@@ -9,12 +9,18 @@ from dataclasses import dataclass
 from typing import List, Optional, Dict, Any
 import logging
 import time
-import random
-from bs4 import BeautifulSoup
-import signal
 import threading
-import platform
-import functools
+from itertools import repeat
+from operator import attrgetter
+from urllib.parse import urlsplit
+from concurrent.futures import ThreadPoolExecutor
+from urllib3.exceptions import ReadTimeoutError
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve
+import lxml.html
+import lxml.etree
+from ..utils.http_utils import create_session
+from .feed_cache import FeedCache, CachedFeed
 
 # Set up logging
 logging.basicConfig(
@@ -23,6 +29,56 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Article pages are read up to this many bytes; the article body is almost
+# always within it, and giant pages are not worth downloading and parsing
+MAX_ARTICLE_BYTES = 512 * 1024
+
+# Content types article text is extracted from; pages served without a
+# Content-Type are still parsed
+_HTML_CONTENT_TYPES = ('text/html', 'application/xhtml+xml')
+
+# CSS selectors used on every fetched article page, compiled once
+_UNWANTED_SELECTOR = soupsieve.compile('script, style, nav, header, footer, .ad, .ads, .advertisement')
+
+# Common article containers, in order of preference
+_ARTICLE_SELECTOR_STRINGS = (
+    'article', '.post-content', '.entry-content', '.article-content',
+    '.post-body', '.article-body', '.story-body', '.story',
+    '.content', 'main', '#content', '#main'
+)
+_ARTICLE_SELECTORS = tuple((selector, soupsieve.compile(selector)) for selector in _ARTICLE_SELECTOR_STRINGS)
+_ARTICLE_CONTAINER_SELECTOR = soupsieve.compile(', '.join(_ARTICLE_SELECTOR_STRINGS))
+
+# Article text only ever comes from the <body>; skipping <head> avoids building
+# tags for its metadata, inline styles and JSON-LD blobs
+_BODY_STRAINER = SoupStrainer('body')
+
+# Feed summaries are handed to lxml as UTF-8 bytes: lxml rejects str input
+# carrying an <?xml encoding=...?> declaration, and a fixed encoding keeps
+# any declared one from being applied to the re-encoded text
+_SUMMARY_PARSER = lxml.html.HTMLParser(encoding='utf-8')
+
+def _is_timeout(error: Exception) -> bool:
+    """
+    Check whether a requests error was caused by the server not answering in time.
+    
+    requests raises ConnectionError rather than Timeout when a read times out
+    while a streamed body is consumed, or once an adapter's retries run out.
+    
+    Args:
+        error: Exception raised by requests
+        
+    Returns:
+        True if the request timed out
+    """
+    if isinstance(error, requests.exceptions.Timeout):
+        return True
+    if not isinstance(error, requests.exceptions.ConnectionError) or not error.args:
+        return False
+    # Exhausted retries wrap the underlying error in a MaxRetryError
+    reason = getattr(error.args[0], 'reason', error.args[0])
+    return isinstance(reason, ReadTimeoutError)
+
 @dataclass
 class RSSItem:
     """Represents a single item from an RSS feed with all necessary information."""
@@ -50,7 +106,10 @@ class RSSFetcher:
     def __init__(self, rss_urls: List[str], max_items_per_feed: int = 25, 
                  max_age_days: int = 3, user_agent: Optional[str] = None,
                  feed_timeout: int = 15, article_timeout: int = 8,
-                 known_problematic_feeds: List[str] = None):
+                 known_problematic_feeds: List[str] = None,
+                 session: Optional[requests.Session] = None,
+                 max_workers: int = 8, max_per_host: int = 2,
+                 feed_cache: Optional[FeedCache] = None):
         """
         Initialize the RSS Fetcher.
         
@@ -62,6 +121,11 @@ class RSSFetcher:
             feed_timeout: Timeout in seconds for RSS feed fetching (default: 15)
             article_timeout: Timeout in seconds for article content fetching (default: 8)
             known_problematic_feeds: List of feed URLs known to cause timeouts (can be pattern matching)
+            session: HTTP session to reuse connections with (defaults to a pooled
+                session that does not retry, as retries are handled per feed)
+            max_workers: Maximum number of feeds fetched concurrently
+            max_per_host: Maximum number of concurrent requests to a single host
+            feed_cache: Store of feed bodies and validators for conditional requests
         """
         self.rss_urls = rss_urls
         self.max_items_per_feed = max_items_per_feed
@@ -69,6 +133,21 @@ class RSSFetcher:
         self.user_agent = user_agent or "AutoBlogger/1.0"
         self.feed_timeout = feed_timeout
         self.article_timeout = article_timeout
+        # Failed feeds are retried with backoff by _fetch_with_retries; an
+        # adapter retrying underneath would multiply the attempts while a
+        # host semaphore is held
+        self.session = session or create_session(total_retries=0)
+        # Sent with every request; the shared session is also used by other
+        # components with their own User-Agent, so it is not set session-wide
+        self.request_headers = {'User-Agent': self.user_agent}
+        self.max_workers = max_workers
+        self.max_per_host = max_per_host
+        self.feed_cache = feed_cache
+        
+        # Feeds are fetched concurrently; these limit how many requests
+        # hit the same host at once so servers are not hammered
+        self._host_semaphores: Dict[str, threading.Semaphore] = {}
+        self._host_semaphores_lock = threading.Lock()
         
         # Keep track of problematic feeds
         self.problematic_feeds = known_problematic_feeds or []
@@ -81,51 +160,36 @@ class RSSFetcher:
         # After this many consecutive timeouts, a feed will be added to problematic_feeds
         self.max_consecutive_timeouts = 2
         
-    # Timeout handler for feed parsing
-    def _timeout_handler(self, signum, frame):
-        """Handler for timeout signal."""
-        raise TimeoutError(f"Timed out after {self.feed_timeout} seconds")
-    
-    # Thread-based timeout for platforms where signals don't work well
-    def _timeout_wrapper(self, func, *args, **kwargs):
-        """Wrapper for functions with timeout using threading (cross-platform)."""
-        result = [None]
-        error = [None]
-        completed = [False]
-        
-        def target():
-            try:
-                result[0] = func(*args, **kwargs)
-                completed[0] = True
-            except Exception as e:
-                error[0] = e
-        
-        thread = threading.Thread(target=target)
-        thread.daemon = True
-        thread.start()
-        thread.join(self.feed_timeout)
-        
-        if not completed[0]:
-            raise TimeoutError(f"Timed out after {self.feed_timeout} seconds")
-        
-        if error[0]:
-            raise error[0]
-            
-        return result[0]
-        
     def _is_problematic_feed(self, url: str) -> bool:
         """Check if a feed URL matches any known problematic feed patterns."""
         return any(problem in url for problem in self.problematic_feeds)
         
+    def _host_semaphore(self, url: str) -> threading.Semaphore:
+        """
+        Get the semaphore limiting concurrent requests to a URL's host.
+        
+        Args:
+            url: URL about to be requested
+            
+        Returns:
+            Semaphore shared by all requests to the same host
+        """
+        host = urlsplit(url).hostname or ''
+        with self._host_semaphores_lock:
+            semaphore = self._host_semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.Semaphore(self.max_per_host)
+                self._host_semaphores[host] = semaphore
+            return semaphore
+    
     def fetch_all_feeds(self) -> List[RSSItem]:
         """
-        Fetch all configured RSS feeds and return a combined list of items.
+        Fetch all configured RSS feeds concurrently and return a combined list of items.
         
         Returns:
             List of RSSItem objects from all feeds, sorted by published date
         """
-        all_items = []
-        
+        urls = []
         for url in self.rss_urls:
             # Skip empty URLs
             if not url.strip():
@@ -135,53 +199,76 @@ class RSSFetcher:
             if self._is_problematic_feed(url):
                 logger.warning(f"Skipping known problematic feed: {url}")
                 continue
-                
-            # Try to fetch the feed with retries
-            max_retries = 3
-            retry_delay = 2  # seconds
             
-            for attempt in range(1, max_retries + 1):
-                try:
-                    items = self.fetch_feed(url)
-                    all_items.extend(items)
-                    
-                    # Reset timeout count on success
-                    if url in self.feed_timeout_count:
-                        del self.feed_timeout_count[url]
-                    
-                    # Add a random delay between requests to be respectful to servers
-                    time.sleep(random.uniform(1.0, 3.0))
-                    break  # Success, break retry loop
-                except TimeoutError as te:
-                    # Track consecutive timeouts
-                    self.feed_timeout_count[url] = self.feed_timeout_count.get(url, 0) + 1
-                    
-                    if self.feed_timeout_count[url] >= self.max_consecutive_timeouts:
-                        # After multiple timeouts, add to problematic feeds list
-                        if url not in self.problematic_feeds:
-                            logger.error(f"Adding {url} to problematic feeds list after {self.feed_timeout_count[url]} consecutive timeouts")
-                            self.problematic_feeds.append(url)
-                    
-                    logger.warning(f"Timeout fetching feed {url} - skipping after {self.feed_timeout} seconds")
-                    break  # Don't retry on timeout, just skip this feed
-                except Exception as e:
-                    if attempt < max_retries:
-                        logger.warning(f"Error fetching feed {url} (attempt {attempt}/{max_retries}): {str(e)}")
-                        time.sleep(retry_delay)
-                        retry_delay *= 2  # Exponential backoff
-                    else:
-                        logger.error(f"Failed to fetch feed {url} after {max_retries} attempts: {str(e)}")
+            urls.append(url)
+        
+        if not urls:
+            return []
+        
+        # Every feed is filtered against the same cutoff
+        cutoff_date = datetime.now() - timedelta(days=self.max_age_days)
+        
+        # Feeds are independent and network-bound, so fetch them in parallel;
+        # results are combined in configuration order before sorting
+        all_items = []
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(urls))) as executor:
+            for items in executor.map(self._fetch_with_retries, urls, repeat(cutoff_date)):
+                all_items.extend(items)
         
         # Sort by published date, newest first
-        all_items.sort(key=lambda x: x.published_date, reverse=True)
+        all_items.sort(key=attrgetter('published_date'), reverse=True)
         return all_items
     
-    def fetch_feed(self, url: str) -> List[RSSItem]:
+    def _fetch_with_retries(self, url: str, cutoff_date: Optional[datetime] = None) -> List[RSSItem]:
+        """
+        Fetch a single feed, retrying failures with exponential backoff.
+        
+        Args:
+            url: URL of the RSS feed to fetch
+            cutoff_date: Items published before this are skipped
+            
+        Returns:
+            List of RSSItem objects from the feed, or an empty list on failure
+        """
+        max_retries = 3
+        retry_delay = 2  # seconds
+        
+        for attempt in range(1, max_retries + 1):
+            try:
+                items = self.fetch_feed(url, cutoff_date)
+                
+                # Reset timeout count on success
+                self.feed_timeout_count.pop(url, None)
+                return items
+            except TimeoutError:
+                # Track consecutive timeouts
+                self.feed_timeout_count[url] = self.feed_timeout_count.get(url, 0) + 1
+                
+                if self.feed_timeout_count[url] >= self.max_consecutive_timeouts:
+                    # After multiple timeouts, add to problematic feeds list
+                    if url not in self.problematic_feeds:
+                        logger.error(f"Adding {url} to problematic feeds list after {self.feed_timeout_count[url]} consecutive timeouts")
+                        self.problematic_feeds.append(url)
+                
+                logger.warning(f"Timeout fetching feed {url} - skipping after {self.feed_timeout} seconds")
+                return []  # Don't retry on timeout, just skip this feed
+            except Exception as e:
+                if attempt < max_retries:
+                    logger.warning(f"Error fetching feed {url} (attempt {attempt}/{max_retries}): {str(e)}")
+                    time.sleep(retry_delay)
+                    retry_delay *= 2  # Exponential backoff
+                else:
+                    logger.error(f"Failed to fetch feed {url} after {max_retries} attempts: {str(e)}")
+        return []
+    
+    def fetch_feed(self, url: str, cutoff_date: Optional[datetime] = None) -> List[RSSItem]:
         """
         Fetch and parse a single RSS feed.
         
         Args:
             url: URL of the RSS feed to fetch
+            cutoff_date: Items published before this are skipped (defaults to
+                max_age_days before now)
             
         Returns:
             List of RSSItem objects from the feed
@@ -189,35 +276,46 @@ class RSSFetcher:
         logger.info(f"Fetching RSS feed: {url}")
         
         try:
-            # Different timeout approach based on platform
-            is_windows = platform.system().lower() == 'windows'
-            
-            if is_windows:
-                # Use threading-based timeout on Windows
-                try:
-                    feed = self._timeout_wrapper(feedparser.parse, url)
-                except TimeoutError:
-                    logger.warning(f"Timeout parsing feed {url} after {self.feed_timeout} seconds")
+            # Download the feed ourselves so the timeout is enforced by the HTTP
+            # client; this works from any thread, unlike a SIGALRM-based timeout
+            cached = self.feed_cache.get(url) if self.feed_cache else None
+            headers = self.request_headers
+            if cached:
+                headers = {**headers, **cached.conditional_headers()}
+            try:
+                with self._host_semaphore(url):
+                    response = self.session.get(url, headers=headers,
+                                                timeout=self.feed_timeout)
+                response.raise_for_status()
+            except requests.exceptions.RequestException as e:
+                if not _is_timeout(e):
                     raise
+                logger.warning(f"Timeout parsing feed {url} after {self.feed_timeout} seconds")
+                raise TimeoutError(f"Timed out after {self.feed_timeout} seconds")
+            
+            # An unchanged feed is parsed from the cached body; its entries
+            # may still include items an earlier run did not get to
+            if cached and response.status_code == 304:
+                logger.info(f"Feed not modified since last fetch: {url}")
+                self.feed_cache.touch(url)
+                downloaded = cached
             else:
-                # Set up a timeout using signal on Unix-like platforms
-                old_handler = signal.signal(signal.SIGALRM, self._timeout_handler)
-                signal.alarm(self.feed_timeout)
-                
-                try:
-                    # Parse the feed with timeout
-                    feed = feedparser.parse(url)
-                    
-                    # Disable the alarm
-                    signal.alarm(0)
-                except TimeoutError:
-                    logger.warning(f"Timeout parsing feed {url} after {self.feed_timeout} seconds")
-                    raise
-                finally:
-                    # Restore the original signal handler
-                    signal.signal(signal.SIGALRM, old_handler)
-                    # Disable the alarm in case of exception before the previous disable
-                    signal.alarm(0)
+                downloaded = CachedFeed(
+                    body=response.content,
+                    url=response.url,
+                    content_type=response.headers.get('Content-Type', ''),
+                    etag=response.headers.get('ETag'),
+                    last_modified=response.headers.get('Last-Modified'),
+                )
+                if self.feed_cache:
+                    self.feed_cache.store(url, downloaded)
+            
+            # Parse the downloaded bytes; the headers let feedparser resolve
+            # relative links and detect the encoding as it would for a URL
+            feed = feedparser.parse(downloaded.body, response_headers={
+                'content-location': downloaded.url,
+                'content-type': downloaded.content_type,
+            })
             
             # Check if the feed was successfully parsed
             if hasattr(feed, 'bozo_exception') and feed.bozo_exception:
@@ -232,37 +330,38 @@ class RSSFetcher:
             source_name = feed.feed.get('title', '') if hasattr(feed, 'feed') else ''
             
             # Calculate the cutoff date
-            cutoff_date = datetime.now() - timedelta(days=self.max_age_days)
+            if cutoff_date is None:
+                cutoff_date = datetime.now() - timedelta(days=self.max_age_days)
             
             items = []
+            needs_article = []
+            # Most feeds list entries newest first; while that holds, the first
+            # entry past the cutoff means every later one is too
+            previous_date = None
+            newest_first = True
             for entry_index, entry in enumerate(feed.entries[:self.max_items_per_feed]):
                 try:
                     # Parse the published date
                     published_date = self._parse_date(entry)
+                    ordered_so_far = newest_first and previous_date is not None
+                    if previous_date is not None and published_date > previous_date:
+                        newest_first = ordered_so_far = False
+                    previous_date = published_date
                     
                     # Skip if older than cutoff date
                     if published_date < cutoff_date:
+                        if ordered_so_far:
+                            logger.debug(f"Stopping at entry {entry_index} of {url}: remaining entries are older than the cutoff")
+                            break
                         continue
                     
                     # Extract image URL if available
                     image_url = self._extract_image_url(entry)
                     
-                    # Extract or fetch full content
+                    # Extract full content; entries without enough of it get
+                    # the article page fetched below
                     content = self._extract_content(entry)
                     
-                    # If we couldn't get content from the RSS feed, try to fetch the article
-                    if not content or len(content) < 200:  # Arbitrary minimum length
-                        try:
-                            link = entry.get('link', '')
-                            if link:
-                                content = self._fetch_article_content(link)
-                            else:
-                                logger.warning(f"No link found for entry {entry_index} in feed {url}")
-                        except TimeoutError:
-                            logger.warning(f"Timeout fetching article content for entry {entry_index} in feed {url}")
-                        except Exception as content_error:
-                            logger.error(f"Error fetching content for entry {entry_index} from {url}: {str(content_error)}")
-                    
                     # Create RSS item
                     item = RSSItem(
                         title=entry.get('title', ''),
@@ -277,10 +376,28 @@ class RSSFetcher:
                     )
                     
                     items.append(item)
+                    
+                    # If we couldn't get content from the RSS feed, try to fetch the article
+                    if not content or len(content) < 200:  # Arbitrary minimum length
+                        if item.link:
+                            needs_article.append((entry_index, item))
+                        else:
+                            logger.warning(f"No link found for entry {entry_index} in feed {url}")
                 except Exception as entry_error:
                     logger.error(f"Error processing entry {entry_index} from feed {url}: {str(entry_error)}")
                     continue
             
+            # Article pages are independent network fetches, so fetch them in
+            # parallel; per-host semaphores keep each site to a few requests
+            if needs_article:
+                with ThreadPoolExecutor(max_workers=min(self.max_workers, len(needs_article))) as executor:
+                    contents = list(executor.map(
+                        lambda pending: self._fetch_entry_content(url, *pending), needs_article
+                    ))
+                for (_, item), content in zip(needs_article, contents):
+                    if content is not None:
+                        item.content = content
+            
             logger.info(f"Fetched {len(items)} items from {url}")
             return items
                 
@@ -291,15 +408,35 @@ class RSSFetcher:
             logger.error(f"Error fetching feed {url}: {str(e)}")
             return []
     
+    def _fetch_entry_content(self, feed_url: str, entry_index: int, item: RSSItem) -> Optional[str]:
+        """
+        Fetch the article page for a feed entry whose feed content was too short.
+        
+        Args:
+            feed_url: URL of the feed the entry came from
+            entry_index: Index of the entry in the feed, for logging
+            item: The item built from the entry
+            
+        Returns:
+            The article content, or None if fetching failed and the feed content should be kept
+        """
+        try:
+            return self._fetch_article_content(item.link)
+        except TimeoutError:
+            logger.warning(f"Timeout fetching article content for entry {entry_index} in feed {feed_url}")
+        except Exception as content_error:
+            logger.error(f"Error fetching content for entry {entry_index} from {feed_url}: {str(content_error)}")
+        return None
+    
     def _parse_date(self, entry: Dict[str, Any]) -> datetime:
         """Parse the published date from an RSS entry."""
         try:
             date_fields = ['published_parsed', 'updated_parsed', 'created_parsed']
             
             for field in date_fields:
-                if hasattr(entry, field) and getattr(entry, field):
+                time_struct = entry.get(field)
+                if time_struct:
                     try:
-                        time_struct = getattr(entry, field)
                         return datetime(*time_struct[:6])
                     except (TypeError, ValueError) as e:
                         logger.debug(f"Error parsing structured date field {field}: {str(e)}")
@@ -308,11 +445,12 @@ class RSSFetcher:
             # If no parsed date is available, try to parse from string
             date_fields = ['published', 'updated', 'created']
             for field in date_fields:
-                if hasattr(entry, field) and getattr(entry, field):
+                date_string = entry.get(field)
+                if date_string:
                     try:
                         # Try to parse the date string, but fall back to current date on failure
                         from dateutil import parser
-                        return parser.parse(getattr(entry, field))
+                        return parser.parse(date_string)
                     except Exception as e:
                         logger.debug(f"Error parsing date string from {field}: {str(e)}")
                         continue
@@ -327,13 +465,15 @@ class RSSFetcher:
     def _extract_author(self, entry: Dict[str, Any]) -> Optional[str]:
         """Extract author information from an RSS entry."""
         try:
-            if hasattr(entry, 'author_detail') and hasattr(entry.author_detail, 'name'):
-                return entry.author_detail.name
-            elif hasattr(entry, 'author'):
-                return entry.author
-            elif hasattr(entry, 'dc_creator'):
-                return entry.dc_creator
-            return None
+            # FeedParserDict.get resolves the same keys as attribute access
+            # without raising and swallowing an AttributeError per miss
+            author_detail = entry.get('author_detail')
+            if author_detail and author_detail.get('name') is not None:
+                return author_detail['name']
+            author = entry.get('author')
+            if author is not None:
+                return author
+            return entry.get('dc_creator')
         except Exception as e:
             logger.error(f"Error extracting author: {str(e)}")
             return None
@@ -344,27 +484,22 @@ class RSSFetcher:
             categories = []
             
             # Try to extract from tags
-            if hasattr(entry, 'tags'):
-                for tag in entry.tags:
-                    try:
-                        if hasattr(tag, 'term'):
-                            categories.append(tag.term)
-                        elif hasattr(tag, 'label'):
-                            categories.append(tag.label)
-                        elif isinstance(tag, dict):
-                            if 'term' in tag:
-                                categories.append(tag['term'])
-                            elif 'label' in tag:
-                                categories.append(tag['label'])
-                    except Exception as tag_error:
-                        logger.debug(f"Error processing tag: {str(tag_error)}")
+            for tag in entry.get('tags') or ():
+                try:
+                    if not isinstance(tag, dict):
                         continue
+                    if 'term' in tag:
+                        categories.append(tag['term'])
+                    elif 'label' in tag:
+                        categories.append(tag['label'])
+                except Exception as tag_error:
+                    logger.debug(f"Error processing tag: {str(tag_error)}")
+                    continue
             
             # Try to extract from categories field
-            if hasattr(entry, 'categories'):
-                for category in entry.categories:
-                    if isinstance(category, str):
-                        categories.append(category)
+            for category in entry.get('categories') or ():
+                if isinstance(category, str):
+                    categories.append(category)
             
             return categories
         except Exception as e:
@@ -375,45 +510,36 @@ class RSSFetcher:
         """Extract the main image URL from an RSS entry."""
         try:
             # Try to get image from media content
-            if hasattr(entry, 'media_content'):
-                for media in entry.media_content:
-                    if isinstance(media, dict) and 'url' in media:
-                        return media['url']
-                    elif hasattr(media, 'url'):
-                        return media.url
+            for media in entry.get('media_content') or ():
+                if isinstance(media, dict) and 'url' in media:
+                    return media['url']
                         
             # Try to get image from media thumbnail
-            if hasattr(entry, 'media_thumbnail'):
-                for thumbnail in entry.media_thumbnail:
-                    if isinstance(thumbnail, dict) and 'url' in thumbnail:
-                        return thumbnail['url']
-                    elif hasattr(thumbnail, 'url'):
-                        return thumbnail.url
+            for thumbnail in entry.get('media_thumbnail') or ():
+                if isinstance(thumbnail, dict) and 'url' in thumbnail:
+                    return thumbnail['url']
             
             # Try to get image from enclosures
-            if hasattr(entry, 'enclosures'):
-                for enclosure in entry.enclosures:
-                    if hasattr(enclosure, 'type') and 'image' in enclosure.type:
-                        if hasattr(enclosure, 'href'):
-                            return enclosure.href
-                        elif isinstance(enclosure, dict) and 'href' in enclosure:
-                            return enclosure['href']
+            for enclosure in entry.get('enclosures') or ():
+                if 'image' in enclosure.get('type', '') and 'href' in enclosure:
+                    return enclosure['href']
             
             # Try to extract from content or summary
             content_fields = ['content', 'summary', 'description']
             for field in content_fields:
-                if hasattr(entry, field):
-                    content_list = getattr(entry, field)
-                    if isinstance(content_list, list):
-                        for content_item in content_list:
-                            if isinstance(content_item, dict) and 'value' in content_item:
-                                urls = self._extract_images_from_html(content_item.value)
-                                if urls:
-                                    return urls[0]
-                    else:
-                        urls = self._extract_images_from_html(getattr(entry, field))
-                        if urls:
-                            return urls[0]
+                content_list = entry.get(field)
+                if content_list is None:
+                    continue
+                if isinstance(content_list, list):
+                    for content_item in content_list:
+                        if isinstance(content_item, dict) and 'value' in content_item:
+                            urls = self._extract_images_from_html(content_item['value'])
+                            if urls:
+                                return urls[0]
+                else:
+                    urls = self._extract_images_from_html(content_list)
+                    if urls:
+                        return urls[0]
             
             return None
         except Exception as e:
@@ -425,25 +551,24 @@ class RSSFetcher:
         """Extract the full content from an RSS entry."""
         try:
             # Try to get content from the 'content' field
-            if hasattr(entry, 'content'):
-                for content in entry.content:
-                    if isinstance(content, dict) and 'value' in content:
-                        return content.value
+            for content in entry.get('content') or ():
+                if isinstance(content, dict) and 'value' in content:
+                    return content['value']
             
             # Try to get from other fields
             for field in ['summary_detail', 'summary']:
-                if hasattr(entry, field):
-                    field_value = getattr(entry, field)
+                field_value = entry.get(field)
+                if field_value is not None:
                     if isinstance(field_value, dict) and 'value' in field_value:
-                        return field_value.value
+                        return field_value['value']
                     else:
                         return str(field_value)
             
             # If nothing else works, try to use description or title
-            if hasattr(entry, 'description'):
-                return entry.description
-            elif hasattr(entry, 'title'):
-                return entry.title
+            for field in ['description', 'title']:
+                field_value = entry.get(field)
+                if field_value is not None:
+                    return field_value
             
             return ""
         except Exception as e:
@@ -457,35 +582,47 @@ class RSSFetcher:
             return ""
             
         try:
-            # Use the requests library with explicit timeout
-            headers = {'User-Agent': self.user_agent}
-            
             try:
-                # First, try using the requests timeout
-                response = requests.get(url, headers=headers, timeout=self.article_timeout)
-                response.raise_for_status()
+                # Use the shared session with an explicit timeout, streaming
+                # the body so only the first MAX_ARTICLE_BYTES are downloaded
+                with self._host_semaphore(url), \
+                        self.session.get(url, headers=self.request_headers,
+                                         timeout=self.article_timeout, stream=True) as response:
+                    response.raise_for_status()
+                    # Feeds sometimes link straight to images, PDFs or media;
+                    # don't download a body there is no article text in
+                    content_type = response.headers.get('Content-Type', '').lower()
+                    if content_type and not content_type.startswith(_HTML_CONTENT_TYPES):
+                        logger.info(f"Skipping article content from {url}: not HTML ({content_type})")
+                        return ""
+                    html = self._read_capped(response, MAX_ARTICLE_BYTES)
+                    # Only trust a declared charset; otherwise let the parser
+                    # detect it from the document
+                    encoding = response.encoding if 'charset' in content_type else None
                 
                 # Parse the HTML
-                soup = BeautifulSoup(response.text, 'lxml')
+                soup = BeautifulSoup(html, 'lxml', from_encoding=encoding, parse_only=_BODY_STRAINER)
                 
                 # Remove unwanted elements (common ads, nav, etc.)
-                for unwanted in soup.select('script, style, nav, header, footer, .ad, .ads, .advertisement'):
+                for unwanted in _UNWANTED_SELECTOR.select(soup):
                     try:
                         unwanted.decompose()
                     except Exception:
                         pass  # Ignore errors when removing elements
                 
-                # Look for article content in common article containers
-                article_selectors = [
-                    'article', '.post-content', '.entry-content', '.article-content',
-                    '.post-body', '.article-body', '.story-body', '.story',
-                    '.content', 'main', '#content', '#main'
-                ]
+                # Look for article content in common article containers, finding
+                # them all in one traversal; candidates are in document order, so
+                # the first one matching a selector is what select_one would return
+                try:
+                    candidates = _ARTICLE_CONTAINER_SELECTOR.select(soup)
+                except Exception as e:
+                    logger.debug(f"Error selecting article containers: {str(e)}")
+                    candidates = []
                 
                 content = ""
-                for selector in article_selectors:
+                for selector, pattern in _ARTICLE_SELECTORS:
                     try:
-                        article = soup.select_one(selector)
+                        article = next((tag for tag in candidates if pattern.match(tag)), None)
                         if article:
                             # Clean up the article text
                             content = article.get_text(separator="\n", strip=True)
@@ -506,34 +643,60 @@ class RSSFetcher:
                 
                 return content
             
-            except requests.exceptions.Timeout:
-                logger.warning(f"Timeout fetching article content from {url} after {self.article_timeout} seconds")
-                return ""
             except requests.exceptions.RequestException as e:
-                logger.error(f"Request error fetching article content from {url}: {str(e)}")
+                if _is_timeout(e):
+                    logger.warning(f"Timeout fetching article content from {url} after {self.article_timeout} seconds")
+                else:
+                    logger.error(f"Request error fetching article content from {url}: {str(e)}")
                 return ""
         
         except Exception as e:
             logger.error(f"Error fetching article content from {url}: {str(e)}")
             return ""
     
+    @staticmethod
+    def _read_capped(response: requests.Response, max_bytes: int) -> bytes:
+        """
+        Read a streamed response body, stopping after max_bytes.
+        
+        Args:
+            response: Response opened with stream=True
+            max_bytes: Maximum number of (decompressed) bytes to read
+            
+        Returns:
+            The body, truncated to max_bytes
+        """
+        chunks = []
+        total = 0
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            chunks.append(chunk)
+            total += len(chunk)
+            if total >= max_bytes:
+                break
+        return b''.join(chunks)[:max_bytes]
+    
     def _extract_images_from_html(self, html_content: str) -> List[str]:
         """Extract image URLs from HTML content."""
-        if not html_content:
+        if not html_content or not html_content.strip():
             return []
         
         try:
-            soup = BeautifulSoup(html_content, 'lxml')
-            images = soup.find_all('img')
+            if isinstance(html_content, str):
+                html_content = html_content.encode('utf-8', 'replace')
+            # Only <img> attributes are needed, so walk lxml's tree directly
+            # instead of building a BeautifulSoup tree on top of it
             urls = []
-            
-            for img in images:
-                if img.has_attr('src'):
-                    urls.append(img['src'])
-                elif img.has_attr('data-src'):
-                    urls.append(img['data-src'])
+            for img in lxml.html.fromstring(html_content, parser=_SUMMARY_PARSER).iter('img'):
+                attrib = img.attrib
+                if 'src' in attrib:
+                    urls.append(attrib['src'])
+                elif 'data-src' in attrib:
+                    urls.append(attrib['data-src'])
                     
             return urls
+        except lxml.etree.ParserError:
+            # Nothing but comments or processing instructions, so no images
+            return []
         except Exception as e:
             logger.error(f"Error extracting image URLs from HTML: {str(e)}")
             return [] 
\ No newline at end of file
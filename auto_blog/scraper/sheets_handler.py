@@ -122,3 +122,37 @@ class GoogleSheetsHandler:
         except Exception as e:
             logger.error(f"Failed to add processed URL: {str(e)}")
             return False
+
+    def add_processed_urls(self, urls: List[str]) -> bool:
+        """
+        Add several processed URLs to the sheet in a single append.
+        
+        Args:
+            urls: The URLs that were processed
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if not urls:
+            return True
+        
+        try:
+            processed_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            rows_data = [[url, processed_date, 'SUCCESS'] for url in urls]
+            
+            # Append after the last row of the table; the API finds the next
+            # empty row, so no separate read is needed
+            self.sheet.values().append(
+                spreadsheetId=self.spreadsheet_id,
+                range=f'{self.sheet_name}!A:C',
+                valueInputOption='RAW',
+                insertDataOption='INSERT_ROWS',
+                body={'values': rows_data}
+            ).execute()
+            
+            logger.info(f"Added {len(urls)} processed URLs to sheet")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to add processed URLs: {str(e)}")
+            return False
@@ -6,6 +6,9 @@ Contains helper functions and utilities.
 from .file_utils import create_directory, get_local_file_path
 from .string_utils import sanitize_filename, truncate_string
 from .post_history import PostHistory
+from .http_utils import create_session, get_session
+from .json_utils import json_dumps, json_loads
 
 __all__ = ['create_directory', 'get_local_file_path', 'sanitize_filename', 
-           'truncate_string', 'PostHistory']
+           'truncate_string', 'PostHistory', 'create_session', 'get_session',
+           'json_dumps', 'json_loads']
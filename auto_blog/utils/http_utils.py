@@ -0,0 +1,65 @@
+"""
+HTTP utilities for the automated blog system.
+"""
+
+import logging
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+def create_session(pool_maxsize: int = 32, total_retries: int = 3,
+                   backoff_factor: float = 0.5) -> requests.Session:
+    """
+    Create a requests session with connection pooling and retry with backoff.
+    Only failed connections and 429/5xx responses are retried: a request whose
+    response timed out or broke off may already have been handled (a POST
+    could be billed twice), so those errors are raised to the caller as-is.
+
+    Args:
+        pool_maxsize: Maximum number of pooled connections per host
+        total_retries: Number of retries for failed requests
+        backoff_factor: Backoff factor between retries in seconds
+
+    Returns:
+        Configured requests session
+    """
+    retry = Retry(
+        total=total_retries,
+        connect=min(total_retries, 1),
+        read=False,
+        other=0,
+        backoff_factor=backoff_factor,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset(['GET', 'POST']),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=pool_maxsize, max_retries=retry)
+
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+def get_session() -> requests.Session:
+    """
+    Get the shared HTTP session, creating it on first use.
+
+    Returns:
+        Shared requests session
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = create_session()
+                logger.debug("Created shared HTTP session")
+    return _session
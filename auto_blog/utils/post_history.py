@@ -4,18 +4,22 @@ Keeps track of previously generated posts to avoid duplicates.
 """
 
 import os
-import json
 import logging
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Set
+from typing import Dict, FrozenSet, List, Optional, Set
+from .json_utils import json_dumps, json_loads
 
 logger = logging.getLogger(__name__)
 
+# Compact the append-only log into the snapshot once it grows past this size
+LOG_COMPACT_BYTES = 5 * 1024 * 1024
+
 class PostHistory:
     """
     Tracks post history to prevent generating duplicate posts.
-    Stores information about processed URLs in a JSON file.
+    Stores information about processed URLs in a JSON snapshot plus an
+    append-only JSON Lines log, so recording new URLs only writes new lines.
     """
     
     def __init__(self, history_file_path: str, max_history_days: int = 90):
@@ -27,39 +31,80 @@ class PostHistory:
             max_history_days: Maximum number of days to keep history for
         """
         self.history_file_path = history_file_path
+        self.log_file_path = os.path.splitext(history_file_path)[0] + '.jsonl'
         self.max_history_days = max_history_days
         self.history = self._load_history()
+        # URLs marked in memory but not yet written to the log
+        self._pending: List[str] = []
         
     def _load_history(self) -> Dict[str, str]:
         """
-        Load post history from JSON file.
+        Load post history from the JSON snapshot and replay the append log.
         
         Returns:
             Dictionary with URLs as keys and dates as values
         """
-        if not os.path.exists(self.history_file_path):
+        history = {}
+        if os.path.exists(self.history_file_path):
+            try:
+                with open(self.history_file_path, 'rb') as f:
+                    history = json_loads(f.read())
+            except Exception as e:
+                logger.error(f"Error loading post history: {str(e)}")
+        else:
             # Create directory if it doesn't exist
             os.makedirs(os.path.dirname(self.history_file_path), exist_ok=True)
-            return {}
         
-        try:
-            with open(self.history_file_path, 'r') as f:
-                history = json.load(f)
-                logger.info(f"Loaded {len(history)} entries from post history")
-                return history
-        except Exception as e:
-            logger.error(f"Error loading post history: {str(e)}")
-            return {}
+        if os.path.exists(self.log_file_path):
+            try:
+                with open(self.log_file_path, 'rb') as f:
+                    for line in f:
+                        try:
+                            entry = json_loads(line)
+                        except ValueError:
+                            # A torn final line from an interrupted append
+                            continue
+                        history[entry["url"]] = entry["ts"]
+            except Exception as e:
+                logger.error(f"Error loading post history log: {str(e)}")
+        
+        if history:
+            logger.info(f"Loaded {len(history)} entries from post history")
+        return history
     
     def _save_history(self):
-        """Save post history to JSON file."""
+        """Compact post history into the JSON snapshot and reset the append log."""
         try:
-            with open(self.history_file_path, 'w') as f:
-                json.dump(self.history, f, indent=2)
+            tmp_path = self.history_file_path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(json_dumps(self.history, indent=True))
+            os.replace(tmp_path, self.history_file_path)
+            if os.path.exists(self.log_file_path):
+                os.remove(self.log_file_path)
             logger.info(f"Saved {len(self.history)} entries to post history")
         except Exception as e:
             logger.error(f"Error saving post history: {str(e)}")
     
+    def _append_log(self, urls: List[str], date: str):
+        """
+        Append entries for the given URLs to the history log in one write.
+        
+        Args:
+            urls: URLs to record
+            date: Date string to record them under
+        """
+        if not urls:
+            return
+        lines = b''.join(json_dumps({"url": url, "ts": self.history.get(url, date)}) + b'\n'
+                         for url in urls)
+        try:
+            with open(self.log_file_path, 'ab') as f:
+                f.write(lines)
+            if os.path.getsize(self.log_file_path) > LOG_COMPACT_BYTES:
+                self._save_history()
+        except Exception as e:
+            logger.error(f"Error appending to post history log: {str(e)}")
+    
     def clean_old_entries(self):
         """Remove entries older than max_history_days."""
         if not self.history:
@@ -86,8 +131,7 @@ class PostHistory:
         Args:
             url: The URL that was processed
         """
-        self.history[url] = datetime.now().strftime('%Y-%m-%d')
-        self._save_history()
+        self.add_processed_urls([url])
     
     def add_processed_urls(self, urls: List[str]):
         """
@@ -96,10 +140,32 @@ class PostHistory:
         Args:
             urls: List of URLs that were processed
         """
-        current_date = datetime.now().strftime('%Y-%m-%d')
         for url in urls:
-            self.history[url] = current_date
-        self._save_history()
+            self.mark_as_processed(url)
+        self.flush()
+    
+    def mark_as_processed(self, url: str):
+        """
+        Mark a URL as processed in memory only; call flush() to persist it.
+        
+        Args:
+            url: The URL that was processed
+        """
+        self.history[url] = datetime.now().strftime('%Y-%m-%d')
+        self._pending.append(url)
+    
+    @property
+    def dirty(self) -> bool:
+        """Whether marked URLs are waiting to be flushed."""
+        return bool(self._pending)
+    
+    def flush(self):
+        """Write all URLs marked since the last flush to the log in one append."""
+        if not self._pending:
+            return
+        current_date = datetime.now().strftime('%Y-%m-%d')
+        pending, self._pending = self._pending, []
+        self._append_log(pending, current_date)
     
     def is_url_processed(self, url: str) -> bool:
         """
@@ -112,7 +178,16 @@ class PostHistory:
             True if the URL has been processed, False otherwise
         """
         return url in self.history
-    
+
+    def as_set(self) -> FrozenSet[str]:
+        """
+        Get all processed URLs as a set for bulk membership checks.
+
+        Returns:
+            Frozen set of processed URLs
+        """
+        return frozenset(self.history)
+
     def filter_unprocessed_urls(self, urls: List[str]) -> List[str]:
         """
         Filter a list of URLs to only include those that haven't been processed.
@@ -123,7 +198,8 @@ class PostHistory:
         Returns:
             List of URLs that haven't been processed
         """
-        return [url for url in urls if not self.is_url_processed(url)]
+        processed = self.history
+        return [url for url in urls if url not in processed]
     
     def get_stats(self) -> Dict[str, int]:
         """
@@ -132,8 +208,9 @@ class PostHistory:
         Returns:
             Dictionary with statistics
         """
+        recent_cutoff = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
         return {
             "total_processed": len(self.history),
             "recent_processed": sum(1 for date in self.history.values() 
-                                   if date >= (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d'))
+                                   if date >= recent_cutoff)
         } 
\ No newline at end of file
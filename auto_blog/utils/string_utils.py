@@ -5,6 +5,11 @@ String utilities for the automated blog system.
 import re
 from typing import Optional
 
+_FILENAME_INVALID_RE = re.compile(r'[\\/*?:"<>|]')
+_WHITESPACE_RE = re.compile(r'\s+')
+_SLUG_STRIP_RE = re.compile(r'[^\w\s-]')
+_SLUG_SEPARATOR_RE = re.compile(r'[\s_-]+')
+
 def sanitize_filename(filename: str) -> str:
     """
     Sanitize a string to make it a valid filename.
@@ -16,9 +21,9 @@ def sanitize_filename(filename: str) -> str:
         Sanitized filename
     """
     # Remove invalid characters
-    sanitized = re.sub(r'[\\/*?:"<>|]', "", filename)
+    sanitized = _FILENAME_INVALID_RE.sub("", filename)
     # Replace spaces and other whitespace with underscores
-    sanitized = re.sub(r'\s+', "_", sanitized)
+    sanitized = _WHITESPACE_RE.sub("_", sanitized)
     # Remove leading/trailing periods and spaces
     sanitized = sanitized.strip(". ")
     
@@ -68,7 +73,8 @@ def extract_words(text: str, count: int = 50) -> str:
     Returns:
         String containing the first N words
     """
-    words = text.split()
+    # maxsplit stops splitting after the words that are kept
+    words = text.split(maxsplit=count)
     return " ".join(words[:count])
 
 def generate_slug(text: str, max_length: int = 50) -> str:
@@ -86,10 +92,10 @@ def generate_slug(text: str, max_length: int = 50) -> str:
     slug = text.lower()
     
     # Remove special characters
-    slug = re.sub(r'[^\w\s-]', '', slug)
+    slug = _SLUG_STRIP_RE.sub('', slug)
     
     # Replace whitespace with hyphens
-    slug = re.sub(r'[\s_-]+', '-', slug)
+    slug = _SLUG_SEPARATOR_RE.sub('-', slug)
     
     # Remove leading/trailing hyphens
     slug = slug.strip('-')
@@ -3,13 +3,13 @@ Webhook handler for managing webhook calls and data processing.
 """
 
 import os
-import json
 import logging
 import random
-import requests
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterable, List, Optional, Set
 from pathlib import Path
 from datetime import datetime, timedelta
+from ..utils.http_utils import get_session
+from ..utils.json_utils import json_dumps, json_loads
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +28,7 @@ def call_webhook(data: Dict[str, Any], webhook_url: str = '') -> List[str]:
         return []
     try:
         headers = {"Content-Type": "application/json"}
-        response = requests.post(url, headers=headers, data=json.dumps(data), timeout=15)
+        response = get_session().post(url, headers=headers, data=json_dumps(data), timeout=15)
         logger.info(f"Webhook response status: {response.status_code}")
         
         if response.status_code != 200:
@@ -37,7 +37,7 @@ def call_webhook(data: Dict[str, Any], webhook_url: str = '') -> List[str]:
             
         # Parse response
         try:
-            response_data = response.json()
+            response_data = json_loads(response.content)
             # Extract URLs from the response format [{'0': url}, ...]
             processed_urls = []
             for item in response_data:
@@ -47,7 +47,7 @@ def call_webhook(data: Dict[str, Any], webhook_url: str = '') -> List[str]:
                         processed_urls.append(url)
             logger.info(f"Extracted {len(processed_urls)} processed URLs from webhook response")
             return processed_urls
-        except json.JSONDecodeError:
+        except ValueError:
             logger.error("Failed to parse webhook response as JSON")
             return []
             
@@ -55,12 +55,12 @@ def call_webhook(data: Dict[str, Any], webhook_url: str = '') -> List[str]:
         logger.error(f"Exception during webhook POST: {str(e)}")
         return []
 
-def filter_unprocessed_items(all_items: List[Any], processed_urls: List[str]) -> List[Any]:
+def filter_unprocessed_items(all_items: List[Any], processed_urls: Iterable[str]) -> List[Any]:
     """
     Filter out items that have already been processed according to webhook data.
     Args:
         all_items: List of RSS items
-        processed_urls: List of URLs that have been processed
+        processed_urls: URLs that have been processed (a set avoids a copy)
     Returns:
         List of unprocessed RSS items
     """
@@ -68,10 +68,14 @@ def filter_unprocessed_items(all_items: List[Any], processed_urls: List[str]) ->
         logger.warning("No processed URLs provided, returning all items")
         return all_items
     
+    # Hash lookups instead of scanning every processed URL per item
+    if not isinstance(processed_urls, (set, frozenset)):
+        processed_urls = frozenset(processed_urls)
+    
     unprocessed = [
         item for item in all_items 
         #filter out items that have already been processed
-        if not any(item.link == url for url in processed_urls)
+        if item.link not in processed_urls
         #filter out items where link or description contains 'sale' word
         if 'sale' not in item.link.lower() and 'sale' not in item.description.lower()
         #filter out items where image_url is not a valid URL
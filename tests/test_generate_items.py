@@ -0,0 +1,126 @@
+"""
+Tests for the producer stage of the post pipeline in auto_blog.main.
+"""
+
+import sys
+import queue
+import threading
+import types
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# auto_blog.config exits when no .env file exists, so the pipeline is tested
+# against a stand-in configuration module
+sys.modules.setdefault('auto_blog.config', types.ModuleType('auto_blog.config'))
+sys.modules['auto_blog.config'].PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+from auto_blog import main  # noqa: E402
+
+class Item:
+    """Minimal RSS item."""
+
+    def __init__(self, title):
+        self.title = title
+        self.link = f"https://example.org/{title}"
+
+def run_pipeline(titles, num_posts, num_workers, outcomes, timeout=5):
+    """
+    Run generate_items producers with a writer loop mirroring main().
+
+    Args:
+        titles: Titles of the candidate items
+        num_posts: Number of posts requested
+        num_workers: Number of producer threads
+        outcomes: Map of title to 'ok', 'skip' or 'fail'
+        timeout: Seconds to wait for each queued result
+
+    Returns:
+        Tuple of (published titles, producers still running)
+    """
+    def fake_generate(item, ai_generator, image_handler, post_generator=None):
+        outcome = outcomes[item.title]
+        if outcome == 'fail':
+            raise main.ContentGenerationError('boom')
+        return None if outcome == 'skip' else ({'title': item.title}, None)
+
+    results = queue.Queue()
+    demand = threading.Semaphore(num_posts)
+    done = threading.Event()
+    items = enumerate(Item(title) for title in titles)
+    items_lock = threading.Lock()
+
+    with mock.patch.object(main, 'generate_rss_item', side_effect=fake_generate):
+        producers = [
+            threading.Thread(
+                target=main.generate_items,
+                args=(items, items_lock, None, None, None, demand, done, results, num_posts),
+                kwargs={'retry_delay': 0},
+                daemon=True
+            )
+            for _ in range(num_workers)
+        ]
+        for producer in producers:
+            producer.start()
+
+        published = []
+        finished_workers = 0
+        while len(published) < num_posts:
+            result = results.get(timeout=timeout)
+            if result is None:
+                finished_workers += 1
+                if finished_workers == num_workers:
+                    break
+                continue
+            item, generated, error = result
+            if error is not None or generated is None:
+                demand.release()
+                continue
+            published.append(item.title)
+
+        done.set()
+        for _ in range(num_workers):
+            demand.release()
+        for producer in producers:
+            producer.join(timeout)
+
+    return published, [producer for producer in producers if producer.is_alive()]
+
+class GenerateItemsTest(unittest.TestCase):
+    """Producers must all finish once the candidate items run out."""
+
+    def test_fewer_viable_items_than_posts_with_several_workers(self):
+        published, running = run_pipeline(
+            ['a', 'b'], num_posts=2, num_workers=2, outcomes={'a': 'ok', 'b': 'skip'}
+        )
+        self.assertEqual(published, ['a'])
+        self.assertEqual(running, [])
+
+    def test_failed_items_with_more_workers_than_items(self):
+        published, running = run_pipeline(
+            ['a', 'b', 'c'], num_posts=3, num_workers=3,
+            outcomes={'a': 'fail', 'b': 'ok', 'c': 'skip'}
+        )
+        self.assertEqual(published, ['b'])
+        self.assertEqual(running, [])
+
+    def test_default_ai_concurrency_with_too_few_items(self):
+        # main() runs min(num_posts, AI_CONCURRENCY) producers; AI_CONCURRENCY defaults to 4
+        num_posts = 5
+        published, running = run_pipeline(
+            ['a', 'b', 'c'], num_posts=num_posts, num_workers=min(num_posts, 4),
+            outcomes={'a': 'ok', 'b': 'fail', 'c': 'skip'}
+        )
+        self.assertEqual(published, ['a'])
+        self.assertEqual(running, [])
+
+    def test_stops_once_enough_posts_are_published(self):
+        published, running = run_pipeline(
+            ['a', 'b', 'c', 'd'], num_posts=2, num_workers=2,
+            outcomes={'a': 'ok', 'b': 'skip', 'c': 'ok', 'd': 'ok'}
+        )
+        self.assertEqual(sorted(published), ['a', 'c'])
+        self.assertEqual(running, [])
+
+if __name__ == '__main__':
+    unittest.main()